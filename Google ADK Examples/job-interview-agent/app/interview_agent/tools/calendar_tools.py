@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from ..utils.calendar_utils import (
     get_calendar_service,
     parse_datetime,
+    parse_iso_datetime,
     create_interview_description,
     find_free_time_slots
 )
@@ -212,8 +213,7 @@ def list_scheduled_interviews(
             if start_time:
                 try:
                     # Parse the start time
-                    start_dt_parsed = datetime.fromisoformat(
-                        start_time.replace("Z", "+00:00"))
+                    start_dt_parsed = parse_iso_datetime(start_time)
                     formatted_time = start_dt_parsed.strftime(
                         "%A, %B %d at %I:%M %p")
                 except:
@@ -360,10 +360,8 @@ def update_interview(
                 end_dt = start_dt + timedelta(minutes=new_duration)
             else:
                 # Calculate existing duration
-                existing_start = datetime.fromisoformat(
-                    event["start"]["dateTime"].replace("Z", "+00:00"))
-                existing_end = datetime.fromisoformat(
-                    event["end"]["dateTime"].replace("Z", "+00:00"))
+                existing_start = parse_iso_datetime(event["start"]["dateTime"])
+                existing_end = parse_iso_datetime(event["end"]["dateTime"])
                 existing_duration = existing_end - existing_start
                 end_dt = start_dt + existing_duration
 
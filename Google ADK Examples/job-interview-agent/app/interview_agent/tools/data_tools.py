@@ -2,12 +2,52 @@
 Data management and reporting tools for interview sessions.
 """
 
-import json
+import functools
+import io
 from typing import Dict, Any, List, Optional
-from pathlib import Path
 from datetime import datetime, timedelta
 
-from ..utils import load_session_data, save_session_data, calculate_interview_score
+from ..utils import (
+    load_session_data,
+    append_session_entries,
+    calculate_interview_score,
+    load_question_bank,
+    get_question_bank_summary,
+    summarize_question_bank,
+    format_category_name,
+)
+
+
+# Maximum number of recommendations included in a report.
+_MAX_RECOMMENDATIONS = 6
+
+# (category, threshold, recommendation) triggered when a category scores below its threshold.
+_RECOMMENDATION_RUBRIC = (
+    ("content_quality", 6,
+     "Prepare more detailed examples that directly relate to the job requirements"),
+    ("structure_clarity", 6,
+     "Practice the STAR method (Situation, Task, Action, Result) for behavioral questions"),
+    ("specificity", 6,
+     "Include specific metrics, numbers, and concrete details in your examples"),
+    ("impact_results", 6,
+     "Focus on highlighting the measurable impact and results of your actions"),
+    ("self_awareness", 6,
+     "Practice reflecting on what you learned from each experience you share"),
+)
+
+# Recommendations added for every interview of a given type.
+_INTERVIEW_TYPE_RECOMMENDATIONS = {
+    "technical": (
+        "Continue practicing coding problems and explaining your thought process aloud",
+        "Review system design concepts and practice drawing architecture diagrams",
+    ),
+    "behavioral": (
+        "Develop a portfolio of 7-10 strong STAR examples covering different competencies",
+    ),
+    "case_study": (
+        "Practice business case frameworks and structured problem-solving approaches",
+    ),
+}
 
 
 def generate_interview_report(session_id: str, include_full_transcript: bool = True) -> Dict[str, Any]:
@@ -139,47 +179,9 @@ def generate_interview_report(session_id: str, include_full_transcript: bool = T
             report["full_transcript"] = True
 
         # Format report text with more professional styling
-        report_text = f"""
-# Interview Performance Assessment Report
-
-## Executive Summary
-**{session_summary['role']} Interview - {performance_analysis['performance_level']} Performance**
-
-* **Overall Score:** {performance_analysis['overall_score']:.1f}/10
-* **Interview Type:** {session_summary['interview_type'].title()}
-* **Date Conducted:** {session_summary['start_time']}
-* **Assessment ID:** {session_id}
-
-## Interview Session Details
-| Parameter | Value |
-|---|---|
-| Position | {session_summary['role']} |
-| Organization | {session_summary['company'] or 'Not specified'} |
-| Difficulty Level | {session_summary['difficulty_level'].title() if session_summary['difficulty_level'] else 'Standard'} |
-| Questions Administered | {session_summary['questions_asked']} |
-| Response Rate | {session_summary['completion_rate']:.1f}% |
-| Focus Areas | {', '.join(session_summary['focus_areas']) if session_summary['focus_areas'] else 'General Assessment'} |
-
-## Performance Assessment
-
-### Competency Ratings
-{chr(10).join([f"* **{cat.replace('_', ' ').title()}:** {score:.1f}/10" for cat, score in performance_analysis['category_breakdown'].items()])}
-
-### Demonstrated Strengths
-{chr(10).join([f"* {strength}" for strength in strengths]) if strengths else "* Candidate shows potential but needs to develop stronger examples through additional practice"}
-
-### Development Opportunities
-{chr(10).join([f"* {area}" for area in areas_for_improvement]) if areas_for_improvement else "* Continue to build on current performance with increased complexity in responses"}
-
-## Professional Development Recommendations
-{chr(10).join([f"* {rec}" for rec in recommendations])}
-
-## Next Steps
-We recommend reviewing this assessment thoroughly and implementing the suggested recommendations. For additional support or to schedule a follow-up coaching session, please contact your assigned career development advisor.
-
----
-*This report is generated based on objective assessment criteria. The insights provided are designed to support professional development and interview preparation.*
-"""
+        report_text = _build_report_text(
+            session_id, session_summary, performance_analysis,
+            strengths, areas_for_improvement, recommendations)
 
         report["formatted_report"] = report_text
 
@@ -210,12 +212,8 @@ def get_question_bank(
     """
     try:
         # Load question bank
-        data_dir = Path(__file__).parent.parent / "data"
-        question_bank_path = data_dir / "question_bank.json"
-
         try:
-            with open(question_bank_path, 'r') as f:
-                question_bank = json.load(f)
+            question_bank = load_question_bank()
         except FileNotFoundError:
             return {
                 "status": "error",
@@ -260,20 +258,12 @@ def get_question_bank(
 
             filtered_bank = final_bank
 
-        # Count questions
-        total_questions = 0
-        question_summary = {}
-
-        for q_type, categories in filtered_bank.items():
-            type_count = 0
-            for cat_name, questions in categories.items():
-                cat_count = len(questions) if isinstance(
-                    questions, list) else 0
-                type_count += cat_count
-                question_summary[f"{q_type}_{cat_name}"] = cat_count
-
-            question_summary[q_type] = type_count
-            total_questions += type_count
+        # Count questions; the unfiltered bank is summarized once when loaded
+        if filtered_bank is question_bank:
+            question_summary, total_questions = get_question_bank_summary()
+        else:
+            question_summary, total_questions = summarize_question_bank(
+                filtered_bank)
 
         return {
             "status": "success",
@@ -327,10 +317,9 @@ def save_interview_progress(
             "custom_data": custom_data if custom_data is not None else {}
         }
 
-        session_data.setdefault("progress_saves", []).append(progress_data)
-
         # Save session
-        success = save_session_data(session_id, session_data)
+        success = append_session_entries(
+            session_id, session_data, {"progress_saves": progress_data})
 
         if success:
             return {
@@ -407,6 +396,7 @@ def load_interview_progress(session_id: str) -> Dict[str, Any]:
         }
 
 
+@functools.lru_cache(maxsize=256)
 def _get_performance_level(score: float) -> str:
     """Get performance level description based on score."""
     if score >= 8.5:
@@ -423,6 +413,79 @@ def _get_performance_level(score: float) -> str:
         return "Requires Significant Work"
 
 
+def _build_report_text(
+    session_id: str,
+    session_summary: Dict[str, Any],
+    performance_analysis: Dict[str, Any],
+    strengths: List[str],
+    areas_for_improvement: List[str],
+    recommendations: List[str]
+) -> str:
+    """Build the Markdown text of the interview report section by section."""
+    buf = io.StringIO()
+
+    buf.write("\n# Interview Performance Assessment Report\n\n## Executive Summary\n")
+    buf.write(
+        f"**{session_summary['role']} Interview - {performance_analysis['performance_level']} Performance**\n\n")
+    buf.write(
+        f"* **Overall Score:** {performance_analysis['overall_score']:.1f}/10\n")
+    buf.write(
+        f"* **Interview Type:** {session_summary['interview_type'].title()}\n")
+    buf.write(f"* **Date Conducted:** {session_summary['start_time']}\n")
+    buf.write(f"* **Assessment ID:** {session_id}\n")
+
+    buf.write("\n## Interview Session Details\n| Parameter | Value |\n|---|---|\n")
+    buf.write(f"| Position | {session_summary['role']} |\n")
+    buf.write(
+        f"| Organization | {session_summary['company'] or 'Not specified'} |\n")
+    buf.write(
+        f"| Difficulty Level | {session_summary['difficulty_level'].title() if session_summary['difficulty_level'] else 'Standard'} |\n")
+    buf.write(
+        f"| Questions Administered | {session_summary['questions_asked']} |\n")
+    buf.write(
+        f"| Response Rate | {session_summary['completion_rate']:.1f}% |\n")
+    buf.write(
+        f"| Focus Areas | {', '.join(session_summary['focus_areas']) if session_summary['focus_areas'] else 'General Assessment'} |\n")
+
+    buf.write("\n## Performance Assessment\n\n### Competency Ratings\n")
+    buf.write(_format_category_breakdown(
+        performance_analysis['category_breakdown']))
+
+    buf.write("\n\n### Demonstrated Strengths\n")
+    if strengths:
+        buf.write("\n".join(f"* {strength}" for strength in strengths))
+    else:
+        buf.write("* Candidate shows potential but needs to develop stronger examples through additional practice")
+
+    buf.write("\n\n### Development Opportunities\n")
+    if areas_for_improvement:
+        buf.write("\n".join(f"* {area}" for area in areas_for_improvement))
+    else:
+        buf.write("* Continue to build on current performance with increased complexity in responses")
+
+    buf.write("\n\n## Professional Development Recommendations\n")
+    buf.write("\n".join(f"* {rec}" for rec in recommendations))
+
+    buf.write("""
+
+## Next Steps
+We recommend reviewing this assessment thoroughly and implementing the suggested recommendations. For additional support or to schedule a follow-up coaching session, please contact your assigned career development advisor.
+
+---
+*This report is generated based on objective assessment criteria. The insights provided are designed to support professional development and interview preparation.*
+""")
+
+    return buf.getvalue()
+
+
+def _format_category_breakdown(breakdown: Dict[str, float]) -> str:
+    """Format category scores as Markdown bullet points for the report."""
+    return "\n".join(
+        f"* **{format_category_name(category)}:** {score:.1f}/10"
+        for category, score in breakdown.items()
+    )
+
+
 def _generate_recommendations(metrics: Dict[str, Any], interview_type: str) -> List[str]:
     """Generate personalized recommendations based on performance metrics."""
     recommendations = []
@@ -445,37 +508,14 @@ def _generate_recommendations(metrics: Dict[str, Any], interview_type: str) -> L
             "Excellent performance! Consider practicing with harder questions to further improve")
 
     # Specific recommendations based on category scores
-    if breakdown.get("content_quality", 0) < 6:
-        recommendations.append(
-            "Prepare more detailed examples that directly relate to the job requirements")
-
-    if breakdown.get("structure_clarity", 0) < 6:
-        recommendations.append(
-            "Practice the STAR method (Situation, Task, Action, Result) for behavioral questions")
-
-    if breakdown.get("specificity", 0) < 6:
-        recommendations.append(
-            "Include specific metrics, numbers, and concrete details in your examples")
-
-    if breakdown.get("impact_results", 0) < 6:
-        recommendations.append(
-            "Focus on highlighting the measurable impact and results of your actions")
-
-    if breakdown.get("self_awareness", 0) < 6:
-        recommendations.append(
-            "Practice reflecting on what you learned from each experience you share")
+    for category, threshold, message in _RECOMMENDATION_RUBRIC:
+        if len(recommendations) >= _MAX_RECOMMENDATIONS:
+            return recommendations
+        if breakdown.get(category, 0) < threshold:
+            recommendations.append(message)
 
     # Interview type specific recommendations
-    if interview_type == "technical":
-        recommendations.append(
-            "Continue practicing coding problems and explaining your thought process aloud")
-        recommendations.append(
-            "Review system design concepts and practice drawing architecture diagrams")
-    elif interview_type == "behavioral":
-        recommendations.append(
-            "Develop a portfolio of 7-10 strong STAR examples covering different competencies")
-    elif interview_type == "case_study":
-        recommendations.append(
-            "Practice business case frameworks and structured problem-solving approaches")
+    recommendations.extend(
+        _INTERVIEW_TYPE_RECOMMENDATIONS.get(interview_type, ()))
 
-    return recommendations[:6]  # Limit to 6 recommendations
+    return recommendations[:_MAX_RECOMMENDATIONS]
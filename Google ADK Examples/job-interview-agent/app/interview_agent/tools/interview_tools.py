@@ -2,13 +2,130 @@
 Interview session management tools for conducting mock interviews.
 """
 
+import functools
 import json
 import random
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
-from ..utils import generate_session_id, save_session_data, load_session_data
+from ..utils import (
+    generate_session_id,
+    save_session_data,
+    load_session_data,
+    SAVE_FAILED,
+    append_session_entries,
+    load_question_bank,
+    get_question_categories,
+    get_question_pool,
+    format_category_name,
+)
+
+# Line separator for joins inside f-string expressions, which cannot contain a backslash.
+_NL = "\n"
+
+# Feedback given when the interviewer has not supplied strengths or improvements.
+_DEFAULT_FEEDBACK_TEMPLATE = (
+    "\n"
+    "**Feedback for Question {question_number}**\n"
+    "\n"
+    "Thank you for your response. Here's my feedback:\n"
+    "\n"
+    "**What went well:**\n"
+    "• You provided a specific example from your experience\n"
+    "• Your answer had a clear structure\n"
+    "• You demonstrated relevant skills for the role\n"
+    "\n"
+    "**Areas for improvement:**\n"
+    "• Consider adding more quantifiable results or metrics\n"
+    "• Expand on the specific actions you took\n"
+    "• Reflect more on what you learned from the experience\n"
+    "\n"
+    "**Suggestions for next time:**\n"
+    "• Use the STAR method more explicitly (Situation, Task, Action, Result)\n"
+    "• Prepare 2-3 variations of each story for different question angles\n"
+    "• Practice timing - aim for 2-3 minutes per response\n"
+    "\n"
+    "Overall, this was a solid response that demonstrates relevant experience!\n"
+    "            "
+)
+
+# Keywords evaluate_answer looks for (as substrings of the lowercased answer),
+# grouped by the score adjustment they trigger.
+_ANSWER_KEYWORDS = {
+    "outcome": ("result", "outcome", "achievement", "impact"),
+    "challenge": ("challenge", "problem", "difficult", "complex"),
+    "star": ("situation", "task", "action", "result"),
+    "impact": ("increased", "decreased", "improved",
+               "saved", "revenue", "efficiency", "success"),
+    "awareness": ("learned", "realize",
+                  "mistake", "improve", "feedback", "next time"),
+}
+
+
+def _build_keyword_matcher(keywords_by_check: Dict[str, Tuple[str, ...]]):
+    """
+    Compile keyword groups into one regex plus a keyword -> checks mapping.
+
+    The regex is a lookahead so every position is tried, and alternatives are
+    ordered longest first. A match therefore stands in for every keyword that
+    is a prefix of it, so each keyword also carries the checks of all the
+    keywords it contains.
+    """
+    checks_by_keyword = {}
+    for check, keywords in keywords_by_check.items():
+        for keyword in keywords:
+            checks_by_keyword.setdefault(keyword, set()).add(check)
+
+    implied_checks = {
+        keyword: frozenset().union(
+            *(checks for other, checks in checks_by_keyword.items() if other in keyword))
+        for keyword in checks_by_keyword
+    }
+    alternatives = sorted(implied_checks, key=len, reverse=True)
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(keyword) for keyword in alternatives) + "))")
+    return pattern, implied_checks
+
+
+_KEYWORD_RE, _KEYWORD_CHECKS = _build_keyword_matcher(_ANSWER_KEYWORDS)
+
+# Single-word keywords can only occur inside a run of letters, so answers are
+# split into words and each distinct word is scanned once; keywords spanning
+# several words are looked up in the whole answer instead.
+_WORD_RE = re.compile(r"[a-z]+")
+_KEYWORD_PHRASES = {
+    keyword: checks for keyword, checks in _KEYWORD_CHECKS.items()
+    if not keyword.isalpha()
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_keyword_checks(word: str) -> frozenset:
+    """Return the keyword checks triggered by the keywords found in one word."""
+    return frozenset().union(
+        *(_KEYWORD_CHECKS[match.group(1)] for match in _KEYWORD_RE.finditer(word)))
+
+_DIGIT_RE = re.compile(r"\d")
+
+# Starting score for each feedback criterion, in reporting order.
+_BASE_SCORES = {
+    "content_quality": 5,
+    "structure_clarity": 5,
+    "specificity": 5,
+    "impact_results": 4,
+    "self_awareness": 5,
+}
+
+# Criterion and bonus for each keyword group found in an answer.
+_KEYWORD_SCORE_BONUSES = {
+    "outcome": ("content_quality", 1),
+    "challenge": ("content_quality", 1),
+    "star": ("structure_clarity", 2),
+    "impact": ("impact_results", 3),
+    "awareness": ("self_awareness", 2),
+}
 
 
 def start_interview_session(
@@ -70,8 +187,7 @@ def start_interview_session(
         }
 
         # Save session data
-        save_success = save_session_data(session_id, session_data)
-        if not save_success:
+        if save_session_data(session_id, session_data) == SAVE_FAILED:
             return {
                 "status": "error",
                 "message": "Failed to save session data."
@@ -209,12 +325,8 @@ def ask_behavioral_question(
             }
 
         # Load question bank
-        data_dir = Path(__file__).parent.parent / "data"
-        question_bank_path = data_dir / "question_bank.json"
-
         try:
-            with open(question_bank_path, 'r') as f:
-                question_bank = json.load(f)
+            question_bank = load_question_bank()
         except FileNotFoundError:
             return {
                 "status": "error",
@@ -240,7 +352,8 @@ def ask_behavioral_question(
 
             if category == "random" or category not in behavioral_questions:
                 # Pick random category
-                available_categories = list(behavioral_questions.keys())
+                available_categories = get_question_categories(
+                    "behavioral_questions")
                 if not available_categories:
                     return {
                         "status": "error",
@@ -251,24 +364,17 @@ def ask_behavioral_question(
                 category_used = category
 
             # Get questions from selected category
-            category_questions = behavioral_questions.get(category_used, [])
-            if not category_questions:
+            category_pool = get_question_pool(
+                "behavioral_questions", category_used)
+            if not category_pool[0]:
                 return {
                     "status": "error",
                     "message": f"No questions available for category: {category_used}"
                 }
 
             # Select a question we haven't asked yet in this session
-            asked_questions = {q.get("question", "")
-                               for q in session_data.get("questions_asked", [])}
-            available_questions = [
-                q for q in category_questions if q["question"] not in asked_questions]
-
-            if not available_questions:
-                # If all questions in category have been asked, pick any from category
-                available_questions = category_questions
-
-            question_data = random.choice(available_questions)
+            question_data = _select_unasked_question(
+                category_pool, session_data)
 
         # Update session data
         question_number = len(session_data.get("questions_asked", [])) + 1
@@ -284,19 +390,24 @@ def ask_behavioral_question(
         session_data.setdefault("questions_asked", []).append(question_entry)
         session_data["current_question"] = question_number
 
-        # Save updated session
-        save_session_data(session_id, session_data)
+        # Save updated session; the save may be deferred by a moment
+        save_status = save_session_data(session_id, session_data)
+        if save_status == SAVE_FAILED:
+            return {
+                "status": "error",
+                "message": "Failed to save session data."
+            }
 
         # Format the question presentation
         question_text = f"""
-**Question {question_number} - {category_used.replace('_', ' ').title()}**
+**Question {question_number} - {format_category_name(category_used)}**
 
 {question_data['question']}
 
 *Please provide a specific example using the STAR method (Situation, Task, Action, Result). Take your time to think of a relevant experience.*
 
 **Key areas to address:**
-{chr(10).join([f"• {point}" for point in question_data.get('key_points', [])])}
+{_NL.join(f"• {point}" for point in question_data.get('key_points', []))}
         """
 
         return {
@@ -307,6 +418,7 @@ def ask_behavioral_question(
                 "current_question": question_number,
                 "total_questions_asked": len(session_data["questions_asked"])
             },
+            "save_status": save_status,
             "follow_up_questions": question_data.get("follow_ups", [])
         }
 
@@ -353,13 +465,9 @@ def ask_technical_question(
                 "message": "Session not found. Please start a new interview session."
             }
 
-        # Load question bank
-        data_dir = Path(__file__).parent.parent / "data"
-        question_bank_path = data_dir / "question_bank.json"
-
+        # Make sure the question bank is available
         try:
-            with open(question_bank_path, 'r') as f:
-                question_bank = json.load(f)
+            load_question_bank()
         except FileNotFoundError:
             return {
                 "status": "error",
@@ -376,10 +484,9 @@ def ask_technical_question(
             }
         else:
             # Get technical questions for domain
-            technical_questions = question_bank.get("technical_questions", {})
-            domain_questions = technical_questions.get(domain, [])
+            domain_pool = get_question_pool("technical_questions", domain)
 
-            if not domain_questions:
+            if not domain_pool[0]:
                 return {
                     "status": "error",
                     "message": f"No technical questions available for domain: {domain}"
@@ -387,21 +494,13 @@ def ask_technical_question(
 
             # Filter by difficulty if specified
             if difficulty != "medium":
-                filtered_questions = [
-                    q for q in domain_questions if q.get("difficulty") == difficulty]
-                if filtered_questions:
-                    domain_questions = filtered_questions
+                difficulty_pool = get_question_pool(
+                    "technical_questions", domain, difficulty)
+                if difficulty_pool[0]:
+                    domain_pool = difficulty_pool
 
             # Select question not asked in this session
-            asked_questions = {q.get("question", "")
-                               for q in session_data.get("questions_asked", [])}
-            available_questions = [
-                q for q in domain_questions if q["question"] not in asked_questions]
-
-            if not available_questions:
-                available_questions = domain_questions
-
-            question_data = random.choice(available_questions)
+            question_data = _select_unasked_question(domain_pool, session_data)
 
         # Update session data
         question_number = len(session_data.get("questions_asked", [])) + 1
@@ -418,13 +517,18 @@ def ask_technical_question(
 
         session_data.setdefault("questions_asked", []).append(question_entry)
         session_data["current_question"] = question_number
-        save_session_data(session_id, session_data)
+        save_status = save_session_data(session_id, session_data)
+        if save_status == SAVE_FAILED:
+            return {
+                "status": "error",
+                "message": "Failed to save session data."
+            }
 
         # Format technical question
         question_text = f"""
 
 
-**Technical Question {question_number} - {domain.replace('_', ' ').title()}**
+**Technical Question {question_number} - {format_category_name(domain)}**
 *Difficulty: {question_data.get('difficulty', difficulty).title()}*
 
 {question_data['question']}
@@ -432,7 +536,7 @@ def ask_technical_question(
 **Please think through this step by step and explain your reasoning out loud.**
 
 **Evaluation criteria: **
-{chr(10).join([f"• {point}" for point in question_data.get('key_points', [])])}
+{_NL.join(f"• {point}" for point in question_data.get('key_points', []))}
 
 Take your time and feel free to ask clarifying questions.
         """
@@ -444,7 +548,8 @@ Take your time and feel free to ask clarifying questions.
             "session_progress": {
                 "current_question": question_number,
                 "total_questions_asked": len(session_data["questions_asked"])
-            }
+            },
+            "save_status": save_status
         }
 
     except Exception as e:
@@ -454,6 +559,24 @@ Take your time and feel free to ask clarifying questions.
         }
 
 
+def _select_unasked_question(
+    pool: Tuple[List[Dict[str, Any]], Tuple[str, ...]],
+    session_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Pick a random question from the pool, preferring ones not yet asked in the session."""
+    questions, question_texts = pool
+    asked_questions = {q.get("question", "")
+                       for q in session_data.get("questions_asked", [])}
+    available = [i for i, text in enumerate(question_texts)
+                 if text not in asked_questions]
+
+    if not available:
+        # If every question in the pool has been asked, pick any of them
+        return random.choice(questions)
+
+    return questions[random.choice(available)]
+
+
 def provide_feedback(
     session_id: str,
     answer_text: str,
@@ -495,41 +618,10 @@ def provide_feedback(
                 "message": "No active question to provide feedback for."
             }
 
-        # Get current question details for better context
-        question_details = None
-        for q in session_data.get("questions_asked", []):
-            if q.get("question_number") == current_question:
-                question_details = q
-                break
-
         # Auto-generate feedback if not provided
         if not strengths and not areas_for_improvement:
-            # Generate feedback based on question type if available
-            question_type = question_details.get("type", "") if question_details else ""
-            category = question_details.get("category", "") if question_details else ""
-            
-            feedback_text = f"""
-**Feedback for Question {current_question}**
-
-Thank you for your response. Here's my feedback:
-
-**What went well:**
-• You provided a specific example from your experience
-• Your answer had a clear structure
-• You demonstrated relevant skills for the role
-
-**Areas for improvement:**
-• Consider adding more quantifiable results or metrics
-• Expand on the specific actions you took
-• Reflect more on what you learned from the experience
-
-**Suggestions for next time:**
-• Use the STAR method more explicitly (Situation, Task, Action, Result)
-• Prepare 2-3 variations of each story for different question angles
-• Practice timing - aim for 2-3 minutes per response
-
-Overall, this was a solid response that demonstrates relevant experience!
-            """
+            feedback_text = _DEFAULT_FEEDBACK_TEMPLATE.format(
+                question_number=current_question)
         else:
             # Use provided feedback
             feedback_parts = [f"**Feedback for Question {current_question}**\n"]
@@ -547,27 +639,31 @@ Overall, this was a solid response that demonstrates relevant experience!
 
             feedback_text = "\n".join(feedback_parts)
 
-        # Store feedback in session
+        # Both entries record the same moment
+        now_iso = datetime.now().isoformat()
+
+        # Store feedback in session; the answer itself is kept only once, in
+        # the answers_given entry this one points to
         feedback_entry = {
             "question_number": current_question,
-            "answer_text": answer_text[:500] + "..." if len(answer_text) > 500 else answer_text,
+            "answer_index": len(session_data.get("answers_given", [])),
             "strengths": strengths,
             "areas_for_improvement": areas_for_improvement,
             "specific_suggestions": specific_suggestions,
-            "feedback_given_at": datetime.now().isoformat()
+            "feedback_given_at": now_iso
         }
 
         # Store answer with timestamp
         answer_entry = {
             "question_number": current_question,
             "answer": answer_text,
-            "answered_at": datetime.now().isoformat()
+            "answered_at": now_iso
         }
 
-        session_data.setdefault("feedback_given", []).append(feedback_entry)
-        session_data.setdefault("answers_given", []).append(answer_entry)
-
-        save_session_data(session_id, session_data)
+        append_session_entries(session_id, session_data, {
+            "feedback_given": feedback_entry,
+            "answers_given": answer_entry,
+        })
 
         return {
             "status": "success",
@@ -588,6 +684,72 @@ Overall, this was a solid response that demonstrates relevant experience!
         }
 
 
+def _load_feedback_criteria() -> Dict[str, Any]:
+    """Load the scoring criteria weights from interview_config.json."""
+    data_dir = Path(__file__).parent.parent / "data"
+    config_path = data_dir / "interview_config.json"
+
+    try:
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+        criteria = config.get("feedback_criteria", {})
+    except FileNotFoundError:
+        # Use default criteria
+        criteria = {
+            "content_quality": {"weight": 0.3},
+            "structure_clarity": {"weight": 0.25},
+            "specificity": {"weight": 0.2},
+            "impact_results": {"weight": 0.15},
+            "self_awareness": {"weight": 0.1}
+        }
+
+    return criteria
+
+
+def _score_answer(answer_text: str) -> Dict[str, int]:
+    """
+    Score an answer from 1-10 on each feedback criterion.
+
+    Simple scoring algorithm (in real implementation, this could use ML).
+    """
+    # Measure the answer once up front
+    answer_length = len(answer_text)
+    sentence_count = answer_text.count('.') + 1
+    word_count = len(answer_text.split())
+    has_digit = _DIGIT_RE.search(answer_text) is not None
+
+    # Find which keyword groups occur in the answer
+    answer_lower = answer_text.lower()
+    matched_checks = set()
+    for word in set(_WORD_RE.findall(answer_lower)):
+        matched_checks |= _word_keyword_checks(word)
+    for phrase, checks in _KEYWORD_PHRASES.items():
+        if phrase in answer_lower:
+            matched_checks |= checks
+
+    # Length and structure bonuses, then the keyword group bonuses
+    scores = dict(_BASE_SCORES)
+    if answer_length > 100:
+        scores["content_quality"] += 1
+    if sentence_count > 3:  # Multiple sentences
+        scores["structure_clarity"] += 1
+    if has_digit:  # Contains numbers/metrics
+        scores["specificity"] += 2
+    if word_count > 50:  # Detailed response
+        scores["specificity"] += 1
+    for check in matched_checks:
+        criterion, bonus = _KEYWORD_SCORE_BONUSES[check]
+        scores[criterion] += bonus
+
+    return {criterion: min(score, 10) for criterion, score in scores.items()}
+
+
+def _weighted_score(scores: Dict[str, int], criteria: Dict[str, Any]) -> float:
+    """Combine per-criterion scores into the weighted overall score."""
+    return sum(
+        scores[criterion] * criteria[criterion]["weight"] for criterion in scores)
+
+
 def evaluate_answer(
     session_id: str,
     answer_text: str,
@@ -613,72 +775,9 @@ def evaluate_answer(
                 "message": "Session not found."
             }
 
-        # Load feedback criteria
-        data_dir = Path(__file__).parent.parent / "data"
-        config_path = data_dir / "interview_config.json"
-
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            criteria = config.get("feedback_criteria", {})
-        except FileNotFoundError:
-            # Use default criteria
-            criteria = {
-                "content_quality": {"weight": 0.3},
-                "structure_clarity": {"weight": 0.25},
-                "specificity": {"weight": 0.2},
-                "impact_results": {"weight": 0.15},
-                "self_awareness": {"weight": 0.1}
-            }
-
-        # Simple scoring algorithm (in real implementation, this could use ML)
-        scores = {}
-
-        # Content Quality (1-10)
-        content_score = 5  # Base score
-        if len(answer_text) > 100:
-            content_score += 1
-        if any(keyword in answer_text.lower() for keyword in ["result", "outcome", "achievement", "impact"]):
-            content_score += 1
-        if any(keyword in answer_text.lower() for keyword in ["challenge", "problem", "difficult", "complex"]):
-            content_score += 1
-        scores["content_quality"] = min(content_score, 10)
-
-        # Structure & Clarity
-        structure_score = 5
-        if any(keyword in answer_text.lower() for keyword in ["situation", "task", "action", "result"]):
-            structure_score += 2
-        if len(answer_text.split('.')) > 3:  # Multiple sentences
-            structure_score += 1
-        scores["structure_clarity"] = min(structure_score, 10)
-
-        # Specificity
-        specificity_score = 5
-        if any(char.isdigit() for char in answer_text):  # Contains numbers/metrics
-            specificity_score += 2
-        if len(answer_text.split()) > 50:  # Detailed response
-            specificity_score += 1
-        scores["specificity"] = min(specificity_score, 10)
-
-        # Impact & Results
-        impact_score = 4
-        impact_keywords = ["increased", "decreased", "improved",
-                           "saved", "revenue", "efficiency", "success"]
-        if any(keyword in answer_text.lower() for keyword in impact_keywords):
-            impact_score += 3
-        scores["impact_results"] = min(impact_score, 10)
-
-        # Self-awareness
-        awareness_score = 5
-        awareness_keywords = ["learned", "realize",
-                              "mistake", "improve", "feedback", "next time"]
-        if any(keyword in answer_text.lower() for keyword in awareness_keywords):
-            awareness_score += 2
-        scores["self_awareness"] = min(awareness_score, 10)
-
-        # Calculate weighted overall score
-        overall_score = sum(
-            scores[criterion] * criteria[criterion]["weight"] for criterion in scores)
+        criteria = _load_feedback_criteria()
+        scores = _score_answer(answer_text)
+        overall_score = _weighted_score(scores, criteria)
 
         # Store evaluation
         evaluation = {
@@ -689,8 +788,7 @@ def evaluate_answer(
             "evaluation_time": datetime.now().isoformat()
         }
 
-        session_data.setdefault("scores", []).append(evaluation)
-        save_session_data(session_id, session_data)
+        append_session_entries(session_id, session_data, {"scores": evaluation})
 
         # Create evaluation summary
         score_interpretation = ""
@@ -731,3 +829,74 @@ def evaluate_answer(
             "status": "error",
             "message": f"Error evaluating answer: {str(e)}"
         }
+
+
+def rescore_sessions(session_ids: List[str]) -> Dict[str, Any]:
+    """
+    Re-score the evaluated answers in the given sessions.
+
+    Each score entry is re-scored against the stored answer to its question;
+    entries whose answer was never stored are left as they are. The scoring
+    criteria are loaded once for the whole batch and each session is saved
+    once.
+
+    Args:
+        session_ids: Identifiers of the sessions to re-score
+
+    Returns:
+        Dictionary with the number of answers re-scored per session
+    """
+    try:
+        criteria = _load_feedback_criteria()
+        evaluation_time = datetime.now().isoformat()
+
+        rescored = {}
+        not_rescored = []
+        for session_id in session_ids:
+            session_data = load_session_data(session_id)
+            if not session_data:
+                not_rescored.append(session_id)
+                continue
+
+            # Latest stored answer per question; answers scored with
+            # evaluate_answer alone are not stored and keep their old score
+            answers = {
+                answer.get("question_number", 0): answer.get("answer", "")
+                for answer in session_data.get("answers_given", [])
+            }
+
+            evaluations = []
+            count = 0
+            for evaluation in session_data.get("scores", []):
+                answer_text = answers.get(evaluation.get("question_number", 0))
+                if answer_text is None:
+                    evaluations.append(evaluation)
+                    continue
+                scores = _score_answer(answer_text)
+                evaluations.append({
+                    **evaluation,
+                    "answer_length": len(answer_text),
+                    "scores": scores,
+                    "overall_score": round(_weighted_score(scores, criteria), 1),
+                    "evaluation_time": evaluation_time
+                })
+                count += 1
+
+            session_data["scores"] = evaluations
+            if save_session_data(session_id, session_data, rewrite_log=True) != SAVE_FAILED:
+                rescored[session_id] = count
+            else:
+                not_rescored.append(session_id)
+
+        return {
+            "status": "success",
+            "message": f"Re-scored {sum(rescored.values())} answers across {len(rescored)} sessions.",
+            "rescored_answers": rescored,
+            "sessions_not_rescored": not_rescored
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error re-scoring sessions: {str(e)}"
+        }
@@ -2,12 +2,225 @@
 Utility functions for the Job Interview Roleplay Agent.
 """
 
+import atexit
 import datetime
-from typing import Dict, Any, List
+import functools
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 import json
 import os
+import re
+import threading
+import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+
+SESSIONS_DIR = Path("interview_sessions")
+
+# Session fields that only ever grow; their entries are stored in an
+# append-only "<session_id>.events.jsonl" log next to the session file.
+# They stay plain lists: appending is already O(1) and a save writes only the
+# entries past the last logged count, found by slicing the list.
+SESSION_LOG_FIELDS = (
+    "questions_asked",
+    "answers_given",
+    "scores",
+    "feedback_given",
+    "progress_saves",
+)
+
+# Timestamp behind the most recent ID from generate_session_id.
+_last_session_id_ns = 0
+
+# Number of entries per log field already written for each known session.
+_logged_entry_counts: Dict[str, Dict[str, int]] = {}
+
+# Saves arriving within this many seconds of a session's last write are
+# coalesced into one write once the interval has passed.
+SESSION_FLUSH_INTERVAL = 0.5
+_pending_saves: Dict[str, Dict[str, Any]] = {}
+_flush_timers: Dict[str, threading.Timer] = {}
+_last_session_write: Dict[str, float] = {}
+_session_write_lock = threading.RLock()
+
+# Results of save_session_data.
+SAVE_WRITTEN = "written"
+SAVE_DEFERRED = "deferred"
+SAVE_FAILED = "failed"
+
+# Recently used sessions with the stat signature of their files when cached.
+_SESSION_CACHE_SIZE = 32
+_SESSION_CACHE: "OrderedDict[str, Tuple[tuple, Dict[str, Any]]]" = OrderedDict()
+
+QUESTION_BANK_PATH = Path(__file__).parent.parent / "data" / "question_bank.json"
+
+# Parsed question bank plus indexes derived from it, refreshed together
+# whenever the file on disk changes.
+_question_bank_cache: Dict[str, Any] = {}
+
+# Answer types reported separately in an interview score breakdown.
+SCORE_CATEGORIES = ("technical", "behavioral", "communication", "problem_solving")
+
+# Formats tried by parse_datetime_string, in order of preference.
+DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%d/%m/%Y %H:%M",
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+)
+
+# The same formats grouped by (contains "/", contains whitespace) of the
+# strings they can match; time formats need whitespace before the hour.
+_DATETIME_FORMATS_BY_SHAPE = {
+    (slashed, spaced): tuple(
+        fmt for fmt in DATETIME_FORMATS
+        if ("/" in fmt) == slashed and (spaced or " " not in fmt)
+    )
+    for slashed in (False, True)
+    for spaced in (False, True)
+}
+_WHITESPACE_RE = re.compile(r"\s")
+
+# Address shape accepted by validate_email.
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+
+def _refresh_question_bank() -> Dict[str, Any]:
+    """Re-parse the question bank if it changed on disk and rebuild its indexes."""
+    mtime = QUESTION_BANK_PATH.stat().st_mtime_ns
+    if _question_bank_cache.get("mtime") != mtime:
+        with open(QUESTION_BANK_PATH, 'r') as f:
+            bank = json.load(f)
+
+        # Questions per (type, category, difficulty), with difficulty None for
+        # the whole category, alongside a column of their question texts.
+        pools = {}
+        for q_type, categories in bank.items():
+            for cat_name, questions in categories.items():
+                pools[(q_type, cat_name, None)] = questions
+                for question in questions:
+                    difficulty = question.get("difficulty")
+                    if difficulty is not None:
+                        pools.setdefault(
+                            (q_type, cat_name, difficulty), []).append(question)
+
+        _question_bank_cache.clear()
+        _question_bank_cache.update({
+            "mtime": mtime,
+            "bank": bank,
+            "categories": {
+                q_type: tuple(categories.keys())
+                for q_type, categories in bank.items()
+                if isinstance(categories, dict)
+            },
+            "pools": {
+                key: (questions, tuple(q["question"] for q in questions))
+                for key, questions in pools.items()
+            },
+            "summary": summarize_question_bank(bank),
+        })
+    return _question_bank_cache
+
+
+def load_question_bank() -> Dict[str, Any]:
+    """
+    Load the interview question bank, parsing the JSON file only when it changes.
+
+    The returned dictionary is shared between callers and must not be mutated.
+
+    Raises:
+        FileNotFoundError: If the question bank file is missing
+    """
+    return _refresh_question_bank()["bank"]
+
+
+def summarize_question_bank(bank: Dict[str, Any]) -> Tuple[Dict[str, int], int]:
+    """
+    Count the questions in a question bank.
+
+    Args:
+        bank: Question bank mapping question types to categories of questions
+
+    Returns:
+        Tuple of the per-category and per-type question counts, and the total
+    """
+    category_counts = {
+        (q_type, cat_name): len(questions) if isinstance(questions, list) else 0
+        for q_type, categories in bank.items()
+        for cat_name, questions in categories.items()
+    }
+    summary = {
+        f"{q_type}_{cat_name}": count
+        for (q_type, cat_name), count in category_counts.items()
+    }
+
+    type_counts = dict.fromkeys(bank, 0)
+    for (q_type, _), count in category_counts.items():
+        type_counts[q_type] += count
+    summary.update(type_counts)
+
+    return summary, sum(category_counts.values())
+
+
+def get_question_bank_summary() -> Tuple[Dict[str, int], int]:
+    """Get the question counts of the full, unfiltered question bank."""
+    return _refresh_question_bank()["summary"]
+
+
+def get_question_categories(question_type: str) -> tuple:
+    """Get the category names available for a question type in the question bank."""
+    return _refresh_question_bank()["categories"].get(question_type, ())
+
+
+def get_question_pool(
+    question_type: str,
+    category: str,
+    difficulty: str = None
+) -> Tuple[List[Dict[str, Any]], Tuple[str, ...]]:
+    """
+    Get the questions of a question bank category.
+
+    Args:
+        question_type: Question type key in the bank (e.g. "technical_questions")
+        category: Category or domain within the question type
+        difficulty: Only include questions of this difficulty; None for all
+
+    Returns:
+        Tuple of the matching questions and their question texts in the same
+        order, both empty if nothing matches
+    """
+    pools = _refresh_question_bank()["pools"]
+    return pools.get((question_type, category, difficulty), ([], ()))
+
+
+def dumps_json_bytes(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(
+        data,
+        default=str,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def loads_json_bytes(data: bytes) -> Any:
+    """Deserialize UTF-8 encoded JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def get_current_time() -> str:
     """Get current date and time formatted for display."""
@@ -15,6 +228,13 @@ def get_current_time() -> str:
     return now.strftime("%Y-%m-%d %H:%M:%S (%A)")
 
 
+@functools.lru_cache(maxsize=64)
+def format_category_name(name: str) -> str:
+    """Format a snake_case category or domain name for display."""
+    return name.replace('_', ' ').title()
+
+
+@functools.lru_cache(maxsize=128)
 def format_interview_duration(minutes: int) -> str:
     """Format interview duration in human-readable format."""
     if minutes < 60:
@@ -45,32 +265,31 @@ def calculate_interview_score(answers: List[Dict[str, Any]]) -> Dict[str, Any]:
             "total_questions": 0
         }
     
-    scores = []
-    categories = {
-        "technical": [],
-        "behavioral": [],
-        "communication": [],
-        "problem_solving": []
-    }
-    
+    # Running totals per category, accumulated in a single pass
+    totals = dict.fromkeys(SCORE_CATEGORIES, 0)
+    counts = dict.fromkeys(SCORE_CATEGORIES, 0)
+    score_total = 0
+    score_count = 0
+
     for answer in answers:
         if "score" in answer:
-            scores.append(answer["score"])
-            
+            score = answer["score"]
+            score_total += score
+            score_count += 1
+
             # Categorize the score
             question_type = answer.get("type", "general")
-            if question_type in categories:
-                categories[question_type].append(answer["score"])
-    
-    overall_score = sum(scores) / len(scores) if scores else 0
-    
-    breakdown = {}
-    for category, category_scores in categories.items():
-        if category_scores:
-            breakdown[category] = sum(category_scores) / len(category_scores)
-        else:
-            breakdown[category] = 0
-    
+            if question_type in counts:
+                totals[question_type] += score
+                counts[question_type] += 1
+
+    overall_score = score_total / score_count if score_count else 0
+
+    breakdown = {
+        category: totals[category] / counts[category] if counts[category] else 0
+        for category in SCORE_CATEGORIES
+    }
+
     return {
         "overall_score": round(overall_score, 1),
         "breakdown": breakdown,
@@ -79,66 +298,352 @@ def calculate_interview_score(answers: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def save_session_data(session_id: str, data: Dict[str, Any]) -> bool:
+def save_session_data(
+    session_id: str,
+    data: Dict[str, Any],
+    rewrite_log: bool = False
+) -> str:
     """
     Save interview session data to file.
-    
+
+    Entries of the fields in SESSION_LOG_FIELDS are appended to the session's
+    event log, so only entries added since the last save are written. Saves
+    within SESSION_FLUSH_INTERVAL of the session's last write are deferred
+    and written together; load_session_data already sees the deferred data.
+    A deferred save is lost if the process is killed before it is written;
+    call flush_session_data when the data must be on disk.
+
     Args:
         session_id: Unique session identifier
         data: Session data to save
-    
+        rewrite_log: Rewrite the whole event log, needed when existing entries
+            of the logged fields were replaced rather than appended to
+
     Returns:
-        True if successful, False otherwise
+        SAVE_WRITTEN if the data was written, SAVE_DEFERRED if it will be
+        written once the flush interval has passed, SAVE_FAILED otherwise
     """
+    with _session_write_lock:
+        elapsed = time.perf_counter() - _last_session_write.get(session_id, float("-inf"))
+        if elapsed < SESSION_FLUSH_INTERVAL and not rewrite_log:
+            _pending_saves[session_id] = data
+            if session_id not in _flush_timers:
+                timer = threading.Timer(
+                    SESSION_FLUSH_INTERVAL - elapsed, flush_session_data, (session_id,))
+                timer.daemon = True
+                _flush_timers[session_id] = timer
+                timer.start()
+            return SAVE_DEFERRED
+
+        if _write_session_data(session_id, data, rewrite_log):
+            return SAVE_WRITTEN
+        return SAVE_FAILED
+
+
+def flush_session_data(session_id: str) -> bool:
+    """
+    Write a deferred save of a session to file, if there is one.
+
+    Args:
+        session_id: Unique session identifier
+
+    Returns:
+        True if successful or nothing was pending, False otherwise
+    """
+    with _session_write_lock:
+        data = _pending_saves.get(session_id)
+        if data is None:
+            return True
+        if _write_session_data(session_id, data):
+            return True
+        # Keep the save pending, so the next save or flush retries it
+        _pending_saves[session_id] = data
+        return False
+
+
+@atexit.register
+def flush_all_session_data() -> None:
+    """Write every deferred session save to file."""
+    with _session_write_lock:
+        for session_id in list(_pending_saves):
+            flush_session_data(session_id)
+
+
+def _write_session_data(
+    session_id: str,
+    data: Dict[str, Any],
+    rewrite_log: bool = False
+) -> bool:
+    """Write session data to file now, replacing any deferred save."""
+    timer = _flush_timers.pop(session_id, None)
+    if timer is not None:
+        timer.cancel()
+    _pending_saves.pop(session_id, None)
+
     try:
-        sessions_dir = Path("interview_sessions")
-        sessions_dir.mkdir(exist_ok=True)
-        
-        file_path = sessions_dir / f"{session_id}.json"
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
-        
+        # Deferred saves run on a timer thread while the caller may still be
+        # changing the same dict; work from a copy taken in one step
+        snapshot = data.copy()
+        _sync_session_log(session_id, snapshot, rewrite_log)
+
+        metadata = {
+            key: [] if key in SESSION_LOG_FIELDS else value
+            for key, value in snapshot.items()
+        }
+        # Write a temporary file and rename it over the session file, so a
+        # crash mid-write never leaves a truncated session behind
+        file_path = SESSIONS_DIR / f"{session_id}.json"
+        tmp_path = SESSIONS_DIR / f"{session_id}.json.{os.getpid()}.tmp"
+        with _open_session_file(tmp_path, 'wb') as f:
+            f.write(dumps_json_bytes(metadata, indent=True))
+        os.replace(tmp_path, file_path)
+
+        _last_session_write[session_id] = time.perf_counter()
+        _cache_session(session_id, data)
         return True
     except Exception as e:
+        _SESSION_CACHE.pop(session_id, None)
         print(f"Error saving session data: {e}")
         return False
 
 
+def append_session_entries(
+    session_id: str,
+    data: Dict[str, Any],
+    entries: Dict[str, Dict[str, Any]]
+) -> bool:
+    """
+    Add new entries to logged session fields and append them to the event log.
+
+    Unlike save_session_data, the session file itself is not rewritten, so
+    this is the cheaper option when nothing else in the session changed.
+
+    Args:
+        session_id: Unique session identifier
+        data: Session data, updated in place with the new entries
+        entries: Mapping of a SESSION_LOG_FIELDS field to the entry to add
+
+    Returns:
+        True if successful, False otherwise
+    """
+    for field, entry in entries.items():
+        data.setdefault(field, []).append(entry)
+
+    try:
+        with _session_write_lock:
+            logged_counts = _logged_entry_counts.get(session_id)
+            if logged_counts is None:
+                # Legacy session: its entries are not in the log yet
+                _sync_session_log(session_id, data, rewrite=True)
+            else:
+                log_path = SESSIONS_DIR / f"{session_id}.events.jsonl"
+                with _open_session_file(log_path, 'ab') as f:
+                    f.writelines(_log_record(field, entry)
+                                 for field, entry in entries.items())
+                for field in entries:
+                    logged_counts[field] += 1
+
+            _cache_session(session_id, data)
+        return True
+    except Exception as e:
+        _SESSION_CACHE.pop(session_id, None)
+        print(f"Error appending session data: {e}")
+        return False
+
+
 def load_session_data(session_id: str) -> Dict[str, Any]:
     """
     Load interview session data from file.
-    
+
+    The result is cached until either session file changes on disk, so the
+    returned dictionary is shared between calls; save any changes made to it.
+
     Args:
         session_id: Unique session identifier
-    
+
     Returns:
         Session data dictionary or empty dict if not found
     """
+    pending = _pending_saves.get(session_id)
+    if pending is not None:
+        return pending
+
     try:
-        sessions_dir = Path("interview_sessions")
-        file_path = sessions_dir / f"{session_id}.json"
-        
-        if file_path.exists():
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        else:
+        file_path = SESSIONS_DIR / f"{session_id}.json"
+
+        signature = _session_signature(session_id)
+        if signature[0] is None:
+            _SESSION_CACHE.pop(session_id, None)
             return {}
+
+        cached = _SESSION_CACHE.get(session_id)
+        if cached is not None and cached[0] == signature:
+            _SESSION_CACHE.move_to_end(session_id)
+            return cached[1]
+
+        data = loads_json_bytes(file_path.read_bytes())
+
+        # Sessions saved before the event log existed keep their entries in
+        # the main file; rewrite the whole log on their next save. Once a log
+        # exists it holds every entry, even if a crash kept the session file
+        # from being rewritten with emptied lists after it.
+        log_path = SESSIONS_DIR / f"{session_id}.events.jsonl"
+        legacy = not log_path.exists() and any(
+            data.get(field) for field in SESSION_LOG_FIELDS)
+
+        logged_counts = dict.fromkeys(SESSION_LOG_FIELDS, 0)
+        if log_path.exists():
+            for field in SESSION_LOG_FIELDS:
+                if field in data:
+                    data[field] = []
+            for record in _read_session_log(log_path):
+                field = record["field"]
+                data.setdefault(field, []).append(record["entry"])
+                logged_counts[field] += 1
+            # Repairing a torn last line changes the log's stat signature
+            signature = _session_signature(session_id)
+
+        if legacy:
+            _logged_entry_counts.pop(session_id, None)
+        else:
+            _logged_entry_counts[session_id] = logged_counts
+
+        _remember_session(session_id, signature, data)
+        return data
     except Exception as e:
         print(f"Error loading session data: {e}")
         return {}
 
 
+def _open_session_file(path: Path, mode: str):
+    """Open a file in SESSIONS_DIR for writing, creating the directory on first use."""
+    try:
+        return open(path, mode)
+    except FileNotFoundError:
+        SESSIONS_DIR.mkdir(exist_ok=True)
+        return open(path, mode)
+
+
+def _session_signature(session_id: str) -> tuple:
+    """Return (mtime_ns, size) of the session file and event log, or None per missing file."""
+    signature = []
+    for path in (SESSIONS_DIR / f"{session_id}.json",
+                 SESSIONS_DIR / f"{session_id}.events.jsonl"):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            signature.append(None)
+        else:
+            signature.append((st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _remember_session(session_id: str, signature: tuple, data: Dict[str, Any]) -> None:
+    """Store session data in the cache, evicting the least recently used session."""
+    _SESSION_CACHE[session_id] = (signature, data)
+    _SESSION_CACHE.move_to_end(session_id)
+    if len(_SESSION_CACHE) > _SESSION_CACHE_SIZE:
+        _SESSION_CACHE.popitem(last=False)
+
+
+def _cache_session(session_id: str, data: Dict[str, Any]) -> None:
+    """Refresh the cached copy of a session after writing it."""
+    signature = _session_signature(session_id)
+    if signature[0] is None:
+        # Only the event log exists yet; nothing loadable to cache.
+        _SESSION_CACHE.pop(session_id, None)
+    else:
+        _remember_session(session_id, signature, data)
+
+
+def _log_record(field: str, entry: Dict[str, Any]) -> bytes:
+    """Format one event log line recording an entry added to a session field."""
+    return dumps_json_bytes({"field": field, "entry": entry}) + b"\n"
+
+
+def _read_session_log(log_path: Path) -> List[Dict[str, Any]]:
+    """
+    Parse every record of a session's event log.
+
+    A crash in the middle of an append can leave the last line incomplete.
+    That line is dropped and cut from the file, so the entries before it are
+    kept and the next append starts on a fresh line.
+    """
+    content = log_path.read_bytes()
+    lines = content.split(b"\n")
+    # A complete log ends with a newline, leaving an empty last element
+    tail = lines.pop()
+
+    records = [loads_json_bytes(line) for line in lines if line.strip()]
+    if not tail.strip():
+        return records
+
+    try:
+        records.append(loads_json_bytes(tail))
+        repair = b"\n"
+    except ValueError:
+        print(f"Dropping incomplete last line of {log_path.name}")
+        repair = None
+
+    with _session_write_lock:
+        if repair is None:
+            with open(log_path, 'r+b') as f:
+                f.truncate(len(content) - len(tail))
+        else:
+            with open(log_path, 'ab') as f:
+                f.write(repair)
+    return records
+
+
+def _sync_session_log(session_id: str, data: Dict[str, Any], rewrite: bool = False) -> None:
+    """
+    Append entries added since the last save to the session's event log.
+
+    The whole log is rewritten instead when asked to, when the session has no
+    known log state (new or legacy sessions) or when a logged field shrank.
+    """
+    logged_counts = _logged_entry_counts.get(session_id)
+    rewrite = rewrite or logged_counts is None or any(
+        len(data.get(field, [])) < logged_counts[field]
+        for field in SESSION_LOG_FIELDS
+    )
+    if rewrite:
+        logged_counts = dict.fromkeys(SESSION_LOG_FIELDS, 0)
+
+    lines = []
+    for field in SESSION_LOG_FIELDS:
+        # Count only the entries written here; the caller may still be
+        # appending to the live list while a deferred save runs
+        new_entries = data.get(field, [])[logged_counts[field]:]
+        lines.extend(_log_record(field, entry) for entry in new_entries)
+        logged_counts[field] += len(new_entries)
+
+    log_path = SESSIONS_DIR / f"{session_id}.events.jsonl"
+    if rewrite:
+        # Replace the log in one step: a crash before the session file is
+        # written must not leave a log half-way between old and new entries
+        tmp_path = SESSIONS_DIR / f"{session_id}.events.jsonl.{os.getpid()}.tmp"
+        with _open_session_file(tmp_path, 'wb') as f:
+            f.writelines(lines)
+        os.replace(tmp_path, log_path)
+    elif lines:
+        with _open_session_file(log_path, 'ab') as f:
+            f.writelines(lines)
+
+    _logged_entry_counts[session_id] = logged_counts
+
+
 def generate_session_id() -> str:
-    """Generate a unique session ID."""
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"interview_{timestamp}"
+    """Generate a unique session ID from the current time in nanoseconds."""
+    global _last_session_id_ns
+    # Coarse clocks can return the same reading twice; IDs must still differ
+    _last_session_id_ns = max(time.time_ns(), _last_session_id_ns + 1)
+    return f"interview_{_last_session_id_ns:016x}"
 
 
 def validate_email(email: str) -> bool:
     """Simple email validation."""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
 def parse_datetime_string(date_str: str) -> datetime.datetime:
@@ -151,17 +656,9 @@ def parse_datetime_string(date_str: str) -> datetime.datetime:
     Returns:
         Parsed datetime object
     """
-    formats = [
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%d %H:%M:%S", 
-        "%m/%d/%Y %H:%M",
-        "%d/%m/%Y %H:%M",
-        "%Y-%m-%d",
-        "%m/%d/%Y",
-        "%d/%m/%Y"
-    ]
-    
-    for fmt in formats:
+    # Formats that cannot match (missing "/" or whitespace) are skipped
+    shape = ("/" in date_str, _WHITESPACE_RE.search(date_str) is not None)
+    for fmt in _DATETIME_FORMATS_BY_SHAPE[shape]:
         try:
             return datetime.datetime.strptime(date_str, fmt)
         except ValueError:
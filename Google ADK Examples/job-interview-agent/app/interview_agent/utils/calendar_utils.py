@@ -2,11 +2,14 @@
 Calendar utilities for interview scheduling, adapted from Jarvis calendar tools.
 """
 
+import atexit
+import functools
 import json
 import os
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -20,48 +23,81 @@ SCOPES = ["https://www.googleapis.com/auth/calendar"]
 TOKEN_PATH = Path(os.path.expanduser("~/.credentials/interview_calendar_token.json"))
 CREDENTIALS_PATH = Path("credentials.json")
 
+# Calendar service shared by all tools, with the credentials it was built from.
+_calendar_service = None
+_calendar_credentials: Optional[Credentials] = None
+_calendar_lock = threading.Lock()
+
 
 def get_calendar_service():
     """
     Authenticate and create a Google Calendar service object.
 
+    The service is built once and reused while its credentials stay valid.
+
     Returns:
         A Google Calendar service object or None if authentication fails
     """
-    creds = None
-
-    # Check if token exists and is valid
-    if TOKEN_PATH.exists():
-        creds = Credentials.from_authorized_user_info(
-            json.loads(TOKEN_PATH.read_text()), SCOPES
-        )
-
-    # If credentials don't exist or are invalid, refresh or get new ones
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            # If credentials.json doesn't exist, we can't proceed with OAuth flow
-            if not CREDENTIALS_PATH.exists():
-                print(
-                    f"Error: {CREDENTIALS_PATH} not found. Please follow setup instructions."
-                )
-                return None
+    global _calendar_service, _calendar_credentials
 
-            flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_PATH, SCOPES)
-            creds = flow.run_local_server(port=0)
+    with _calendar_lock:
+        if _calendar_service is not None and _calendar_credentials.valid:
+            return _calendar_service
 
-        # Save the credentials for the next run
-        TOKEN_PATH.parent.mkdir(exist_ok=True)
-        TOKEN_PATH.write_text(creds.to_json())
+        creds = _calendar_credentials
 
-    # Build and return the Calendar service
-    try:
-        service = build("calendar", "v3", credentials=creds)
+        # Check if token exists and is valid
+        if creds is None and TOKEN_PATH.exists():
+            creds = Credentials.from_authorized_user_info(
+                json.loads(TOKEN_PATH.read_text()), SCOPES
+            )
+
+        # If credentials don't exist or are invalid, refresh or get new ones
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                # If credentials.json doesn't exist, we can't proceed with OAuth flow
+                if not CREDENTIALS_PATH.exists():
+                    print(
+                        f"Error: {CREDENTIALS_PATH} not found. Please follow setup instructions."
+                    )
+                    return None
+
+                flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_PATH, SCOPES)
+                creds = flow.run_local_server(port=0)
+
+            # Save the credentials for the next run
+            TOKEN_PATH.parent.mkdir(exist_ok=True)
+            TOKEN_PATH.write_text(creds.to_json())
+
+        # Build and return the Calendar service
+        try:
+            service = build("calendar", "v3", credentials=creds)
+        except Exception as e:
+            print(f"Error building calendar service: {e}")
+            return None
+
+        _calendar_service = service
+        _calendar_credentials = creds
         return service
-    except Exception as e:
-        print(f"Error building calendar service: {e}")
-        return None
+
+
+@atexit.register
+def close_calendar_service() -> None:
+    """
+    Close the cached calendar service so the next request authenticates again.
+
+    Registered to run at interpreter exit, releasing the service's HTTP
+    connections.
+    """
+    global _calendar_service, _calendar_credentials
+
+    with _calendar_lock:
+        if _calendar_service is not None:
+            _calendar_service.close()
+        _calendar_service = None
+        _calendar_credentials = None
 
 
 def parse_datetime(datetime_str: str) -> Optional[datetime]:
@@ -84,6 +120,18 @@ def parse_datetime(datetime_str: str) -> Optional[datetime]:
             return None
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp from the Calendar API, including a trailing "Z".
+
+    Results are cached, since the same event times are formatted repeatedly.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
 def format_event_details(event: Dict[str, Any]) -> str:
     """Format calendar event details for display."""
     title = event.get("summary", "No title")
@@ -97,8 +145,8 @@ def format_event_details(event: Dict[str, Any]) -> str:
     if start_time and end_time:
         try:
             # Parse and format times
-            start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-            end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+            start_dt = parse_iso_datetime(start_time)
+            end_dt = parse_iso_datetime(end_time)
             
             time_str = f"{start_dt.strftime('%Y-%m-%d %H:%M')} - {end_dt.strftime('%H:%M')}"
         except:
@@ -170,6 +218,33 @@ def create_interview_description(
     return "\n".join(description_parts)
 
 
+def _merge_busy_intervals(busy_times: List[Dict[str, str]]) -> List[Tuple[datetime, datetime]]:
+    """
+    Parse free/busy periods into sorted, non-overlapping (start, end) pairs.
+
+    Times are converted to naive UTC to match the search period, which is sent
+    to the free/busy query as UTC.
+    """
+    intervals = []
+    for busy in busy_times:
+        busy_start = parse_iso_datetime(busy["start"])
+        busy_end = parse_iso_datetime(busy["end"])
+        if busy_start.tzinfo is not None:
+            busy_start = busy_start.astimezone(timezone.utc).replace(tzinfo=None)
+            busy_end = busy_end.astimezone(timezone.utc).replace(tzinfo=None)
+        intervals.append((busy_start, busy_end))
+
+    intervals.sort()
+    merged: List[Tuple[datetime, datetime]] = []
+    for busy_start, busy_end in intervals:
+        if merged and busy_start <= merged[-1][1]:
+            if busy_end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], busy_end)
+        else:
+            merged.append((busy_start, busy_end))
+    return merged
+
+
 def find_free_time_slots(
     start_date: datetime,
     end_date: datetime,
@@ -203,6 +278,8 @@ def find_free_time_slots(
         
         response = service.freebusy().query(body=body).execute()
         busy_times = response.get("calendars", {}).get("primary", {}).get("busy", [])
+        busy_intervals = _merge_busy_intervals(busy_times)
+        busy_index = 0
         
         # Generate potential time slots (9 AM to 6 PM, weekdays only)
         free_slots = []
@@ -226,15 +303,14 @@ def find_free_time_slots(
             
             slot_end = current + timedelta(minutes=duration_minutes)
             
-            # Check if this slot conflicts with any busy time
-            is_free = True
-            for busy in busy_times:
-                busy_start = datetime.fromisoformat(busy["start"].replace("Z", "+00:00"))
-                busy_end = datetime.fromisoformat(busy["end"].replace("Z", "+00:00"))
-                
-                if (current < busy_end and slot_end > busy_start):
-                    is_free = False
-                    break
+            # Slots only move forward, so busy intervals that ended are done with
+            while (busy_index < len(busy_intervals)
+                   and busy_intervals[busy_index][1] <= current):
+                busy_index += 1
+
+            # Check if this slot conflicts with the next busy interval
+            is_free = (busy_index == len(busy_intervals)
+                       or slot_end <= busy_intervals[busy_index][0])
             
             if is_free:
                 free_slots.append({
@@ -7,7 +7,7 @@ from typing import AsyncIterable
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Query, WebSocket
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from google.adk.agents import LiveRequestQueue
 from google.adk.agents.run_config import RunConfig
@@ -16,6 +16,8 @@ from google.adk.runners import Runner
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
 from interview_agent.agent import root_agent
+from interview_agent.tools import generate_interview_report
+from interview_agent.utils import dumps_json_bytes
 
 #
 # ADK Streaming
@@ -186,6 +188,23 @@ async def root():
     return FileResponse(os.path.join(STATIC_DIR, "index.html"))
 
 
+@app.get("/report/{session_id}")
+def report(session_id: str, include_full_transcript: bool = True):
+    """Serves the interview report as JSON, encoded once"""
+    result = generate_interview_report(session_id, include_full_transcript)
+
+    # Errors keep the tool's body but get a matching HTTP status
+    status_code = 200
+    if result.get("status") == "error":
+        status_code = 404 if result["message"] == "Session not found." else 500
+
+    return Response(
+        content=dumps_json_bytes(result),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(
     websocket: WebSocket,
@@ -0,0 +1,91 @@
+"""Import tasks from a CSV file into the saved session without going through the model.
+
+Usage:
+    python bulk_import.py tasks.csv
+
+The CSV needs a header row with a project_index (1-based) and a name column.
+assigned_to, due_date and status are optional and default the same way as in add_task.
+"""
+
+import csv
+import sys
+from types import SimpleNamespace
+
+from google.adk.events import Event, EventActions
+
+from main import APP_NAME, USER_ID, migrate_session, session_service
+from project_management_agent.agent import add_task
+from utils import RecordingState
+
+
+def import_tasks(rows) -> tuple:
+    """Add each CSV row as a task and save the result to the session as a single state update.
+
+    Returns:
+        (number of tasks imported, list of (line number, error message) for rejected rows)
+    """
+    # ===== PART 1: Load the existing session =====
+    existing_sessions = session_service.list_sessions(
+        app_name=APP_NAME,
+        user_id=USER_ID,
+    )
+    if not existing_sessions or not existing_sessions.sessions:
+        raise SystemExit("No saved session found. Run main.py once to create one.")
+
+    session = session_service.get_session(
+        app_name=APP_NAME,
+        user_id=USER_ID,
+        session_id=existing_sessions.sessions[0].id,
+    )
+    migrate_session(session)
+    tool_context = SimpleNamespace(state=RecordingState(session.state))
+
+    # ===== PART 2: Run add_task for every row =====
+    imported = 0
+    errors = []
+    for line_number, row in enumerate(rows, 2):
+        try:
+            project_index = int(row["project_index"])
+        except (KeyError, TypeError, ValueError):
+            errors.append((line_number, f"Invalid project_index: {row.get('project_index')}"))
+            continue
+
+        result = add_task(
+            project_index,
+            tool_context,
+            name=row.get("name") or None,
+            assigned_to=row.get("assigned_to") or None,
+            due_date=row.get("due_date") or None,
+            status=row.get("status") or None,
+        )
+        if result.get("status") == "error":
+            errors.append((line_number, result["message"]))
+        else:
+            imported += 1
+
+    # ===== PART 3: Persist all changes as one event =====
+    state = tool_context.state
+    if state.written:
+        session_service.append_event(
+            session,
+            Event(
+                author="user",
+                actions=EventActions(
+                    state_delta={key: state[key] for key in state.written}
+                ),
+            ),
+        )
+
+    return imported, errors
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        raise SystemExit(__doc__)
+
+    with open(sys.argv[1], newline="", encoding="utf-8") as csv_file:
+        imported, errors = import_tasks(csv.DictReader(csv_file))
+
+    print(f"Imported {imported} tasks.")
+    for line_number, message in errors:
+        print(f"  Line {line_number}: {message}")
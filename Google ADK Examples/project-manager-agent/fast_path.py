@@ -0,0 +1,121 @@
+"""Answer a few exact, unambiguous commands directly with the agent's tools, without a model call.
+
+Anything that does not match one of the patterns below goes to the agent as usual.
+Both the user's message and the reply are saved to the session as events, so the
+agent still sees them as part of the conversation on later turns.
+"""
+
+import re
+from types import SimpleNamespace
+
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from project_management_agent.agent import (
+    delete_project,
+    get_project_status,
+    update_user_name,
+    view_projects,
+    view_team_members,
+)
+from utils import RESPONSE_FOOTER, RESPONSE_HEADER, Colors, RecordingState
+
+# How many messages were answered here vs. passed to the agent
+FAST_PATH_STATS = {"hits": 0, "misses": 0}
+
+
+def _format_projects(result):
+    projects = result["projects"]
+    if not projects:
+        return "You don't have any projects yet. Want to add one?"
+    return "\n".join(
+        f"{idx}. {project['name']} (due {project['due_date']}) - {len(project['tasks'])} tasks"
+        for idx, project in enumerate(projects, 1)
+    )
+
+
+def _format_team_members(result):
+    team_members = result["team_members"]
+    if not team_members:
+        return "You don't have any team members yet. Want to add one?"
+    return "\n".join(
+        f"{idx}. {member['name']} - {member['role']} ({member['email']})"
+        for idx, member in enumerate(team_members, 1)
+    )
+
+
+def _format_project_status(result):
+    if result.get("status") == "error":
+        return result["message"]
+    return f"{result['message']}. Deadline: {result['deadline_status']}."
+
+
+def _format_message(result):
+    return result["message"]
+
+
+# (pattern, tool, how to build the tool's arguments from the match, how to format the result)
+FAST_PATH_COMMANDS = (
+    (re.compile(r"(?:show|view|list)(?: my)? projects", re.IGNORECASE),
+     view_projects, lambda match: (), _format_projects),
+    (re.compile(r"(?:show|view|list)(?: my)? team(?: members)?", re.IGNORECASE),
+     view_team_members, lambda match: (), _format_team_members),
+    (re.compile(r"(?:status of project|project status) (\d+)", re.IGNORECASE),
+     get_project_status, lambda match: (int(match.group(1)),), _format_project_status),
+    (re.compile(r"delete project (\d+)", re.IGNORECASE),
+     delete_project, lambda match: (int(match.group(1)),), _format_message),
+    # A first name, optionally with a last name; anything longer is a sentence for the agent
+    (re.compile(r"my name is ([A-Za-z][A-Za-z'-]*(?: (?!(?:and|or|but|so|then)\b)[A-Za-z][A-Za-z'-]*)?)",
+                re.IGNORECASE),
+     update_user_name, lambda match: (match.group(1),), _format_message),
+)
+
+
+def try_fast_path(runner, user_id, session_id, query):
+    """Run the query directly if it matches a fast-path command.
+
+    Returns:
+        The reply text if the query was handled, otherwise None
+    """
+    text = query.strip().rstrip(".!")
+    for pattern, tool, get_args, format_result in FAST_PATH_COMMANDS:
+        match = pattern.fullmatch(text)
+        if match:
+            break
+    else:
+        FAST_PATH_STATS["misses"] += 1
+        return None
+    FAST_PATH_STATS["hits"] += 1
+
+    # Run the tool against the saved session state
+    session = runner.session_service.get_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id
+    )
+    tool_context = SimpleNamespace(state=RecordingState(session.state))
+    reply = format_result(tool(*get_args(match), tool_context))
+
+    # Save the exchange (and any state change) like an agent turn would
+    invocation_id = Event.new_id()
+    runner.session_service.append_event(
+        session,
+        Event(
+            invocation_id=invocation_id,
+            author="user",
+            content=types.Content(role="user", parts=[types.Part(text=query)]),
+        ),
+    )
+    state = tool_context.state
+    runner.session_service.append_event(
+        session,
+        Event(
+            invocation_id=invocation_id,
+            author=runner.agent.name,
+            content=types.Content(role="model", parts=[types.Part(text=reply)]),
+            actions=EventActions(state_delta={key: state[key] for key in state.written}),
+        ),
+    )
+
+    print(RESPONSE_HEADER)
+    print(f"{Colors.CYAN}{Colors.BOLD}{reply}{Colors.RESET}")
+    print(RESPONSE_FOOTER)
+    return reply
@@ -1,12 +1,25 @@
 import asyncio
 
 from dotenv import load_dotenv
+
+# Load .env before importing the agent so it can read MODEL
+load_dotenv()
+
+from google.adk.events import Event, EventActions
 from google.adk.runners import Runner
 from google.adk.sessions import DatabaseSessionService
-from project_management_agent.agent import project_management_agent
+from project_management_agent.agent import (
+    normalize_task_statuses,
+    project_management_agent,
+    summarize_projects,
+    summarize_team_members,
+)
+from fast_path import FAST_PATH_STATS, try_fast_path
 from utils import call_agent_async
 
-load_dotenv()
+# Setup constants (also used by bulk_import.py)
+APP_NAME = "Project Management Assistant"
+USER_ID = "project_manager_user"
 
 # ===== PART 1: Initialize Persistent Session Service =====
 # Using SQLite database for persistent storage
@@ -19,15 +32,37 @@ session_service = DatabaseSessionService(db_url=db_url)
 initial_state = {
     "user_name": "Project Manager",
     "projects": [],
-    "team_members": []
+    "team_members": [],
+    # Compact versions of the lists above that the agent instruction shows
+    "projects_summary": summarize_projects([]),
+    "team_summary": summarize_team_members([]),
 }
 
 
-async def main_async():
-    # Setup constants
-    APP_NAME = "Project Management Assistant"
-    USER_ID = "project_manager_user"
+def migrate_session(session):
+    """Bring the state of a session saved by an older version up to date in one event."""
+    state_delta = {}
+
+    # Task statuses are stored lowercase; tools compare them directly
+    projects = session.state.get("projects", [])
+    if normalize_task_statuses(projects):
+        state_delta["projects"] = projects
+
+    # The instruction shows these summaries, and a missing key fails the turn.
+    # Each is checked on its own: a tool may have written one but not the other.
+    if "projects_summary" not in session.state:
+        state_delta["projects_summary"] = summarize_projects(projects)
+    if "team_summary" not in session.state:
+        state_delta["team_summary"] = summarize_team_members(session.state.get("team_members", []))
 
+    if state_delta:
+        session_service.append_event(
+            session,
+            Event(author="user", actions=EventActions(state_delta=state_delta)),
+        )
+
+
+async def main_async():
     # ===== PART 3: Session Management - Find or Create =====
     # Check for existing sessions for this user
     existing_sessions = session_service.list_sessions(
@@ -40,6 +75,14 @@ async def main_async():
         # Use the most recent session
         SESSION_ID = existing_sessions.sessions[0].id
         print(f"Continuing existing session: {SESSION_ID}")
+
+        migrate_session(
+            session_service.get_session(
+                app_name=APP_NAME,
+                user_id=USER_ID,
+                session_id=SESSION_ID,
+            )
+        )
     else:
         # Create a new session with initial state
         new_session = session_service.create_session(
@@ -70,10 +113,15 @@ async def main_async():
         # Check if user wants to exit
         if user_input.lower() in ["exit", "quit"]:
             print("Ending conversation. Your data has been saved to the database.")
+            print(
+                f"Answered {FAST_PATH_STATS['hits']} of "
+                f"{FAST_PATH_STATS['hits'] + FAST_PATH_STATS['misses']} messages without a model call."
+            )
             break
 
-        # Process the user query through the agent
-        await call_agent_async(runner, USER_ID, SESSION_ID, user_input)
+        # Simple commands are answered directly; everything else goes through the agent
+        if try_fast_path(runner, USER_ID, SESSION_ID, user_input) is None:
+            await call_agent_async(runner, USER_ID, SESSION_ID, user_input)
 
 
 if __name__ == "__main__":
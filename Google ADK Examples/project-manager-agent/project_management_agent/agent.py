@@ -1,9 +1,204 @@
 from google.adk.agents import Agent
 from google.adk.tools.tool_context import ToolContext
-from datetime import datetime
+import logging
+import os
+import re
+import threading
+import uuid
+from bisect import insort
+from collections import OrderedDict
+from datetime import date
 from typing import Optional
 
 
+logger = logging.getLogger(__name__)
+
+# Model for the interactive agent; override with MODEL in .env
+MODEL = os.getenv("MODEL", "gemini-2.0-flash")
+
+# Task statuses, in the order they are listed to the user
+TASK_STATUSES = ("not started", "in progress", "completed")
+_VALID_STATUSES = frozenset(TASK_STATUSES)
+_VALID_STATUSES_STR = ", ".join(TASK_STATUSES)
+
+# How many projects/team members are listed in the instruction summaries
+SUMMARY_LIMIT = 10
+
+# Recent search results, keyed by the projects version they were computed from
+_SEARCH_CACHE_SIZE = 128
+_SEARCH_CACHE = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+# Only the YYYY-MM-DD shape; newer Pythons' fromisoformat also accepts 20250131 etc.
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+def _is_valid_date(value: str) -> bool:
+    """Check that a date string is a real calendar date in YYYY-MM-DD format."""
+    # Reject malformed input without raising; only out-of-range days/months reach the parser
+    if not _ISO_DATE_RE.fullmatch(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _err(action: str, message: str) -> dict:
+    """Build a tool error response."""
+    return {"action": action, "status": "error", "message": message}
+
+
+def _get_indexed(items: list, index: int, action: str, label: str, scope: str = ""):
+    """Look up an item by its 1-based index.
+
+    Returns:
+        (item, None) if the index is valid, otherwise (None, error response)
+    """
+    if index < 1 or index > len(items):
+        return None, _err(
+            action, f"Could not find {label} at position {index}{scope}. Currently there are {len(items)} {label}s.")
+    return items[index - 1], None
+
+
+def normalize_task_statuses(projects: list) -> bool:
+    """Lowercase, in place, task statuses stored before they were canonicalized on write.
+
+    Returns:
+        True if any task was changed
+    """
+    changed = False
+    for project in projects:
+        for task in project["tasks"]:
+            status = task["status"]
+            if not status.islower():
+                task["status"] = status.lower()
+                changed = True
+    return changed
+
+
+def _build_status_index(projects: list) -> dict:
+    """Map each task status to the sorted [project_index, task_index] pairs (1-based) holding it."""
+    index = {status: [] for status in TASK_STATUSES}
+    for proj_idx, project in enumerate(projects, 1):
+        for task_idx, task in enumerate(project["tasks"], 1):
+            # Lowercased as before, in case a session skipped the status migration
+            bucket = index.get(task["status"].lower())
+            if bucket is not None:
+                bucket.append([proj_idx, task_idx])
+    return index
+
+
+def _get_status_index(tool_context: ToolContext, projects: list) -> dict:
+    """Return the status index from state, building it for sessions that predate it."""
+    index = tool_context.state.get("_status_index")
+    if index is None:
+        index = _build_status_index(projects)
+        tool_context.state["_status_index"] = index
+    return index
+
+
+def summarize_projects(projects: list) -> str:
+    """Describe the projects in one line for the instruction; the tools return the details."""
+    if not projects:
+        return "none yet"
+    listed = "; ".join(
+        f"{idx}. {project['name']} (due {project['due_date']}, {len(project['tasks'])} tasks)"
+        for idx, project in enumerate(projects[:SUMMARY_LIMIT], 1)
+    )
+    more = f"; ... {len(projects) - SUMMARY_LIMIT} more" if len(projects) > SUMMARY_LIMIT else ""
+    return f"{len(projects)} projects: {listed}{more}"
+
+
+def summarize_team_members(team_members: list) -> str:
+    """Describe the team members in one line for the instruction."""
+    if not team_members:
+        return "none yet"
+    listed = "; ".join(
+        f"{idx}. {member['name']} ({member['role']})"
+        for idx, member in enumerate(team_members[:SUMMARY_LIMIT], 1)
+    )
+    more = f"; ... {len(team_members) - SUMMARY_LIMIT} more" if len(team_members) > SUMMARY_LIMIT else ""
+    return f"{len(team_members)} team members: {listed}{more}"
+
+
+def _save_projects(tool_context: ToolContext, projects: list) -> None:
+    """Write the projects and their summary back to state under a new version for the search cache."""
+    tool_context.state["projects"] = projects
+    tool_context.state["projects_summary"] = summarize_projects(projects)
+    # Random rather than a counter so versions never repeat across sessions
+    tool_context.state["_projects_version"] = uuid.uuid4().hex
+
+
+def _match_projects(projects: list, query_lower: str, include_description: bool) -> list:
+    """Return the projects whose name (or description) contains the lowercased query."""
+    return [
+        {"index": idx, "project": project}
+        for idx, project in enumerate(projects, 1)
+        if (query_lower in project["name"].lower() or
+            (include_description and query_lower in project["description"].lower()))
+    ]
+
+
+def _match_tasks(projects: list, query_lower: str, project_index: Optional[int]) -> list:
+    """Return the tasks whose name contains the lowercased query, optionally in one project."""
+    if project_index is not None:
+        searched = [(project_index, projects[project_index - 1])]
+    else:
+        searched = enumerate(projects, 1)
+    return [
+        {
+            "project_index": proj_idx,
+            "project_name": project["name"],
+            "task_index": task_idx,
+            "task": task
+        }
+        for proj_idx, project in searched
+        for task_idx, task in enumerate(project["tasks"], 1)
+        if query_lower in task["name"].lower()
+    ]
+
+
+def _search(tool_context: ToolContext, match, *args) -> list:
+    """Run a match function over the projects, reusing results while the projects are unchanged."""
+    projects = tool_context.state.get("projects", [])
+    version = tool_context.state.get("_projects_version")
+    if version is None:
+        return match(projects, *args)
+
+    key = (version, match, *args)
+    with _search_cache_lock:
+        matches = _SEARCH_CACHE.get(key)
+        if matches is not None:
+            _SEARCH_CACHE.move_to_end(key)
+            return matches
+
+    matches = match(projects, *args)
+    with _search_cache_lock:
+        _SEARCH_CACHE[key] = matches
+        if len(_SEARCH_CACHE) > _SEARCH_CACHE_SIZE:
+            _SEARCH_CACHE.popitem(last=False)
+    return matches
+
+
+def _save_team_members(tool_context: ToolContext, team_members: list) -> None:
+    """Write the team members and their summary back to state."""
+    tool_context.state["team_members"] = team_members
+    tool_context.state["team_summary"] = summarize_team_members(team_members)
+
+
+def _apply_changes(record: dict, updates: dict) -> dict:
+    """Set each provided (truthy) field on a record and return the old and new values."""
+    changes = {}
+    for field, value in updates.items():
+        if value:
+            changes[field] = {"old": record.get(field), "new": value}
+            record[field] = value
+    return changes
+
+
 # ===== PROJECT MANAGEMENT TOOLS =====
 
 def add_project(name: str, tool_context: ToolContext, description: Optional[str] = None, due_date: Optional[str] = None) -> dict:
@@ -18,7 +213,7 @@ def add_project(name: str, tool_context: ToolContext, description: Optional[str]
     Returns:
         A confirmation message
     """
-    print(f"--- Tool: add_project called for '{name}' ---")
+    logger.debug("--- Tool: add_project called for '%s' ---", name)
 
     # Handle default values inside the function
     if description is None:
@@ -27,15 +222,9 @@ def add_project(name: str, tool_context: ToolContext, description: Optional[str]
         due_date = "2025-12-31"
 
     # Validate date format (YYYY-MM-DD)
-    try:
-        if due_date:
-            datetime.strptime(due_date, "%Y-%m-%d")
-    except ValueError:
-        return {
-            "action": "add_project",
-            "status": "error",
-            "message": f"Invalid date format: {due_date}. Please use YYYY-MM-DD format."
-        }
+    if due_date and not _is_valid_date(due_date):
+        return _err(
+            "add_project", f"Invalid date format: {due_date}. Please use YYYY-MM-DD format.")
 
     # Get current projects from state
     projects = tool_context.state.get("projects", [])
@@ -46,14 +235,14 @@ def add_project(name: str, tool_context: ToolContext, description: Optional[str]
         "description": description,
         "due_date": due_date,
         "tasks": [],
-        "created_at": datetime.now().strftime("%Y-%m-%d")
+        "created_at": date.today().isoformat()
     }
 
     # Add the new project
     projects.append(new_project)
 
     # Update state with the new list of projects
-    tool_context.state["projects"] = projects
+    _save_projects(tool_context, projects)
 
     return {
         "action": "add_project",
@@ -71,7 +260,7 @@ def view_projects(tool_context: ToolContext) -> dict:
     Returns:
         The list of projects
     """
-    print("--- Tool: view_projects called ---")
+    logger.debug("--- Tool: view_projects called ---")
 
     # Get projects from state
     projects = tool_context.state.get("projects", [])
@@ -83,6 +272,41 @@ def view_projects(tool_context: ToolContext) -> dict:
     }
 
 
+def list_project_titles(tool_context: ToolContext, offset: int = 0, limit: int = 20) -> dict:
+    """List project names page by page, without their tasks.
+
+    Args:
+        tool_context: Context for accessing session state
+        offset: How many projects to skip from the start (optional)
+        limit: How many projects to list (optional)
+
+    Returns:
+        The index, name, due date and task count of each project in the page
+    """
+    logger.debug("--- Tool: list_project_titles called with offset %s, limit %s ---", offset, limit)
+
+    # Get projects from state
+    projects = tool_context.state.get("projects", [])
+
+    offset = max(offset, 0)
+    page = [
+        {
+            "index": idx,
+            "name": project["name"],
+            "due_date": project["due_date"],
+            "task_count": len(project["tasks"])
+        }
+        for idx, project in enumerate(projects[offset:offset + max(limit, 0)], offset + 1)
+    ]
+
+    return {
+        "action": "list_project_titles",
+        "projects": page,
+        "count": len(page),
+        "total": len(projects)
+    }
+
+
 def update_project(index: int, tool_context: ToolContext, name: Optional[str] = None, description: Optional[str] = None, due_date: Optional[str] = None) -> dict:
     """Update an existing project.
 
@@ -96,46 +320,37 @@ def update_project(index: int, tool_context: ToolContext, name: Optional[str] =
     Returns:
         A confirmation message
     """
-    print(f"--- Tool: update_project called for index {index} ---")
+    logger.debug("--- Tool: update_project called for index %s ---", index)
 
     # Get current projects from state
     projects = tool_context.state.get("projects", [])
 
     # Check if the index is valid
-    if not projects or index < 1 or index > len(projects):
-        return {
-            "action": "update_project",
-            "status": "error",
-            "message": f"Could not find project at position {index}. Currently there are {len(projects)} projects."
-        }
+    project, error = _get_indexed(projects, index, "update_project", "project")
+    if error:
+        return error
 
-    # Get the project to update (adjusting for 0-based indices)
-    project = projects[index - 1]
-    old_project = project.copy()    # Update the project fields if provided
-    if name:
-        project["name"] = name
-    if description:
-        project["description"] = description
-    if due_date:
-        # Validate date format
-        try:
-            datetime.strptime(due_date, "%Y-%m-%d")
-            project["due_date"] = due_date
-        except ValueError:
-            return {
-                "action": "update_project",
-                "status": "error",
-                "message": f"Invalid date format: {due_date}. Please use YYYY-MM-DD format."
-            }
+    # Validate date format before changing anything
+    if due_date and not _is_valid_date(due_date):
+        return _err(
+            "update_project", f"Invalid date format: {due_date}. Please use YYYY-MM-DD format.")
 
-    # Update state with the modified list
-    tool_context.state["projects"] = projects
+    # Update the project fields if provided
+    changes = _apply_changes(project, {
+        "name": name,
+        "description": description,
+        "due_date": due_date
+    })
+
+    # Update state with the modified list; an update that changed nothing
+    # would only add a redundant state delta to the session
+    if changes:
+        _save_projects(tool_context, projects)
 
     return {
         "action": "update_project",
         "index": index,
-        "old_project": old_project,
-        "updated_project": project,
+        "changes": changes,
         "message": f"Updated project {index}: '{project['name']}'"
     }
 
@@ -150,24 +365,22 @@ def delete_project(index: int, tool_context: ToolContext) -> dict:
     Returns:
         A confirmation message
     """
-    print(f"--- Tool: delete_project called for index {index} ---")
+    logger.debug("--- Tool: delete_project called for index %s ---", index)
 
     # Get current projects from state
     projects = tool_context.state.get("projects", [])
 
     # Check if the index is valid
-    if not projects or index < 1 or index > len(projects):
-        return {
-            "action": "delete_project",
-            "status": "error",
-            "message": f"Could not find project at position {index}. Currently there are {len(projects)} projects."
-        }
+    _, error = _get_indexed(projects, index, "delete_project", "project")
+    if error:
+        return error
 
     # Remove the project (adjusting for 0-based indices)
     deleted_project = projects.pop(index - 1)
 
-    # Update state with the modified list
-    tool_context.state["projects"] = projects
+    # Update state with the modified list; later positions have shifted
+    _save_projects(tool_context, projects)
+    tool_context.state["_status_index"] = _build_status_index(projects)
 
     return {
         "action": "delete_project",
@@ -195,8 +408,7 @@ def add_task(project_index: int, tool_context: ToolContext, name: Optional[str]
     Returns:
         A confirmation message
     """
-    print(
-        f"--- Tool: add_task called for project {project_index}, task '{name}' ---")
+    logger.debug("--- Tool: add_task called for project %s, task '%s' ---", project_index, name)
 
     # Handle default values inside the function
     if name is None:
@@ -209,35 +421,23 @@ def add_task(project_index: int, tool_context: ToolContext, name: Optional[str]
         status = "not started"
 
     # Validate date format
-    try:
-        if due_date:
-            datetime.strptime(due_date, "%Y-%m-%d")
-    except ValueError:
-        return {
-            "action": "add_task",
-            "status": "error",
-            "message": f"Invalid date format: {due_date}. Please use YYYY-MM-DD format."
-        }
+    if due_date and not _is_valid_date(due_date):
+        return _err(
+            "add_task", f"Invalid date format: {due_date}. Please use YYYY-MM-DD format.")
 
     # Validate status
-    valid_statuses = ["not started", "in progress", "completed"]
-    if status.lower() not in valid_statuses:
-        return {
-            "action": "add_task",
-            "status": "error",
-            "message": f"Invalid status: {status}. Please use one of: {', '.join(valid_statuses)}."
-        }
+    if status.lower() not in _VALID_STATUSES:
+        return _err(
+            "add_task", f"Invalid status: {status}. Please use one of: {_VALID_STATUSES_STR}.")
+    status = status.lower()
 
     # Get current projects from state
     projects = tool_context.state.get("projects", [])
 
     # Check if the project index is valid
-    if not projects or project_index < 1 or project_index > len(projects):
-        return {
-            "action": "add_task",
-            "status": "error",
-            "message": f"Could not find project at position {project_index}. Currently there are {len(projects)} projects."
-        }
+    project, error = _get_indexed(projects, project_index, "add_task", "project")
+    if error:
+        return error
 
     # Create a new task
     new_task = {
@@ -245,15 +445,17 @@ def add_task(project_index: int, tool_context: ToolContext, name: Optional[str]
         "assigned_to": assigned_to,
         "due_date": due_date,
         "status": status,
-        "created_at": datetime.now().strftime("%Y-%m-%d")
+        "created_at": date.today().isoformat()
     }
 
-    # Add the task to the project
-    project = projects[project_index - 1]
+    # Add the task to the project and the status index
+    status_index = _get_status_index(tool_context, projects)
     project["tasks"].append(new_task)
+    insort(status_index[status], [project_index, len(project["tasks"])])
 
     # Update state with the modified project list
-    tool_context.state["projects"] = projects
+    _save_projects(tool_context, projects)
+    tool_context.state["_status_index"] = status_index
 
     return {
         "action": "add_task",
@@ -280,69 +482,60 @@ def update_task(project_index: int, task_index: int, tool_context: ToolContext,
     Returns:
         A confirmation message
     """
-    print(
-        f"--- Tool: update_task called for project {project_index}, task {task_index} ---")
+    logger.debug("--- Tool: update_task called for project %s, task %s ---", project_index, task_index)
 
     # Get current projects from state
     projects = tool_context.state.get("projects", [])
 
     # Check if the project index is valid
-    if not projects or project_index < 1 or project_index > len(projects):
-        return {
-            "action": "update_task",
-            "status": "error",
-            "message": f"Could not find project at position {project_index}. Currently there are {len(projects)} projects."
-        }
-
-    # Get the project and check if the task index is valid
-    project = projects[project_index - 1]
-    tasks = project.get("tasks", [])
-
-    if not tasks or task_index < 1 or task_index > len(tasks):
-        return {
-            "action": "update_task",
-            "status": "error",
-            "message": f"Could not find task at position {task_index} in project '{project['name']}'. Currently there are {len(tasks)} tasks."
-        }
-
-    # Get the task to update
-    task = tasks[task_index - 1]
-    old_task = task.copy()    # Update the task fields if provided
-    if name:
-        task["name"] = name
-    if assigned_to:
-        task["assigned_to"] = assigned_to
-    if due_date:
-        # Validate date format
-        try:
-            datetime.strptime(due_date, "%Y-%m-%d")
-            task["due_date"] = due_date
-        except ValueError:
-            return {
-                "action": "update_task",
-                "status": "error",
-                "message": f"Invalid date format: {due_date}. Please use YYYY-MM-DD format."
-            }
+    project, error = _get_indexed(projects, project_index, "update_task", "project")
+    if error:
+        return error
+
+    # Check if the task index is valid
+    tasks = project["tasks"]
+    task, error = _get_indexed(
+        tasks, task_index, "update_task", "task", f" in project '{project['name']}'")
+    if error:
+        return error
+
+    # Validate date format and status before changing anything
+    if due_date and not _is_valid_date(due_date):
+        return _err(
+            "update_task", f"Invalid date format: {due_date}. Please use YYYY-MM-DD format.")
+    if status and status.lower() not in _VALID_STATUSES:
+        return _err(
+            "update_task", f"Invalid status: {status}. Please use one of: {_VALID_STATUSES_STR}.")
     if status:
-        # Validate status
-        valid_statuses = ["not started", "in progress", "completed"]
-        if status.lower() not in valid_statuses:
-            return {
-                "action": "update_task",
-                "status": "error",
-                "message": f"Invalid status: {status}. Please use one of: {', '.join(valid_statuses)}."
-            }
-        task["status"] = status
+        status = status.lower()
 
-    # Update state with the modified project list
-    tool_context.state["projects"] = projects
+    # Update the task fields if provided
+    status_index = _get_status_index(tool_context, projects)
+    changes = _apply_changes(task, {
+        "name": name,
+        "assigned_to": assigned_to,
+        "due_date": due_date,
+        "status": status
+    })
+
+    # Move the task to its new status bucket
+    if "status" in changes:
+        position = [project_index, task_index]
+        old_bucket = status_index.get(changes["status"]["old"].lower())
+        if old_bucket is not None:
+            old_bucket.remove(position)
+        insort(status_index[status], position)
+        tool_context.state["_status_index"] = status_index
+
+    # Update state with the modified project list, if anything changed
+    if changes:
+        _save_projects(tool_context, projects)
 
     return {
         "action": "update_task",
         "project": project["name"],
         "task": task["name"],
-        "old_task": old_task,
-        "updated_task": task,
+        "changes": changes,
         "message": f"Updated task '{task['name']}' in project '{project['name']}'"
     }
 
@@ -358,36 +551,29 @@ def delete_task(project_index: int, task_index: int, tool_context: ToolContext)
     Returns:
         A confirmation message
     """
-    print(
-        f"--- Tool: delete_task called for project {project_index}, task {task_index} ---")
+    logger.debug("--- Tool: delete_task called for project %s, task %s ---", project_index, task_index)
 
     # Get current projects from state
     projects = tool_context.state.get("projects", [])
 
     # Check if the project index is valid
-    if not projects or project_index < 1 or project_index > len(projects):
-        return {
-            "action": "delete_task",
-            "status": "error",
-            "message": f"Could not find project at position {project_index}. Currently there are {len(projects)} projects."
-        }
-
-    # Get the project and check if the task index is valid
-    project = projects[project_index - 1]
-    tasks = project.get("tasks", [])
+    project, error = _get_indexed(projects, project_index, "delete_task", "project")
+    if error:
+        return error
 
-    if not tasks or task_index < 1 or task_index > len(tasks):
-        return {
-            "action": "delete_task",
-            "status": "error",
-            "message": f"Could not find task at position {task_index} in project '{project['name']}'. Currently there are {len(tasks)} tasks."
-        }
+    # Check if the task index is valid
+    tasks = project["tasks"]
+    _, error = _get_indexed(
+        tasks, task_index, "delete_task", "task", f" in project '{project['name']}'")
+    if error:
+        return error
 
     # Remove the task
     deleted_task = tasks.pop(task_index - 1)
 
-    # Update state with the modified project list
-    tool_context.state["projects"] = projects
+    # Update state with the modified project list; later positions have shifted
+    _save_projects(tool_context, projects)
+    tool_context.state["_status_index"] = _build_status_index(projects)
 
     return {
         "action": "delete_task",
@@ -411,7 +597,7 @@ def add_team_member(name: str, role: str, email: str, tool_context: ToolContext)
     Returns:
         A confirmation message
     """
-    print(f"--- Tool: add_team_member called for '{name}' ---")
+    logger.debug("--- Tool: add_team_member called for '%s' ---", name)
 
     # Get current team members from state
     team_members = tool_context.state.get("team_members", [])
@@ -427,7 +613,7 @@ def add_team_member(name: str, role: str, email: str, tool_context: ToolContext)
     team_members.append(new_member)
 
     # Update state with the new list of team members
-    tool_context.state["team_members"] = team_members
+    _save_team_members(tool_context, team_members)
 
     return {
         "action": "add_team_member",
@@ -445,7 +631,7 @@ def view_team_members(tool_context: ToolContext) -> dict:
     Returns:
         The list of team members
     """
-    print("--- Tool: view_team_members called ---")
+    logger.debug("--- Tool: view_team_members called ---")
 
     # Get team members from state
     team_members = tool_context.state.get("team_members", [])
@@ -470,39 +656,31 @@ def update_team_member(index: int, tool_context: ToolContext, name: Optional[str
     Returns:
         A confirmation message
     """
-    print(f"--- Tool: update_team_member called for index {index} ---")
+    logger.debug("--- Tool: update_team_member called for index %s ---", index)
 
     # Get current team members from state
     team_members = tool_context.state.get("team_members", [])
 
     # Check if the index is valid
-    if not team_members or index < 1 or index > len(team_members):
-        return {
-            "action": "update_team_member",
-            "status": "error",
-            "message": f"Could not find team member at position {index}. Currently there are {len(team_members)} team members."
-        }
-
-    # Get the team member to update
-    member = team_members[index - 1]
-    old_member = member.copy()
+    member, error = _get_indexed(team_members, index, "update_team_member", "team member")
+    if error:
+        return error
 
     # Update the team member fields if provided
-    if name:
-        member["name"] = name
-    if role:
-        member["role"] = role
-    if email:
-        member["email"] = email
+    changes = _apply_changes(member, {
+        "name": name,
+        "role": role,
+        "email": email
+    })
 
-    # Update state with the modified list
-    tool_context.state["team_members"] = team_members
+    # Update state with the modified list, if anything changed
+    if changes:
+        _save_team_members(tool_context, team_members)
 
     return {
         "action": "update_team_member",
         "index": index,
-        "old_member": old_member,
-        "updated_member": member,
+        "changes": changes,
         "message": f"Updated team member {index}: '{member['name']}' ({member['role']})"
     }
 
@@ -517,24 +695,21 @@ def delete_team_member(index: int, tool_context: ToolContext) -> dict:
     Returns:
         A confirmation message
     """
-    print(f"--- Tool: delete_team_member called for index {index} ---")
+    logger.debug("--- Tool: delete_team_member called for index %s ---", index)
 
     # Get current team members from state
     team_members = tool_context.state.get("team_members", [])
 
     # Check if the index is valid
-    if not team_members or index < 1 or index > len(team_members):
-        return {
-            "action": "delete_team_member",
-            "status": "error",
-            "message": f"Could not find team member at position {index}. Currently there are {len(team_members)} team members."
-        }
+    _, error = _get_indexed(team_members, index, "delete_team_member", "team member")
+    if error:
+        return error
 
     # Remove the team member
     deleted_member = team_members.pop(index - 1)
 
     # Update state with the modified list
-    tool_context.state["team_members"] = team_members
+    _save_team_members(tool_context, team_members)
 
     return {
         "action": "delete_team_member",
@@ -554,17 +729,10 @@ def search_projects(query: str, tool_context: ToolContext) -> dict:
     Returns:
         Matching projects with their indices
     """
-    print(f"--- Tool: search_projects called with query '{query}' ---")
-
-    # Get projects from state
-    projects = tool_context.state.get("projects", [])
+    logger.debug("--- Tool: search_projects called with query '%s' ---", query)
 
     # Search for matches
-    matches = []
-    for idx, project in enumerate(projects, 1):
-        if (query.lower() in project["name"].lower() or
-                query.lower() in project["description"].lower()):
-            matches.append({"index": idx, "project": project})
+    matches = _search(tool_context, _match_projects, query.lower(), True)
 
     return {
         "action": "search_projects",
@@ -585,7 +753,7 @@ def update_user_name(name: str, tool_context: ToolContext) -> dict:
     Returns:
         A confirmation message
     """
-    print(f"--- Tool: update_user_name called with '{name}' ---")
+    logger.debug("--- Tool: update_user_name called with '%s' ---", name)
 
     # Get current name from state
     old_name = tool_context.state.get("user_name", "")
@@ -611,30 +779,17 @@ def search_tasks(query: str, tool_context: ToolContext) -> dict:
     Returns:
         Matching tasks with their project and task indices
     """
-    print(f"--- Tool: search_tasks called with query '{query}' ---")
-
-    # Get projects from state
-    projects = tool_context.state.get("projects", [])
+    logger.debug("--- Tool: search_tasks called with query '%s' ---", query)
 
     # Search for matching tasks across all projects
-    matches = []
-    for proj_idx, project in enumerate(projects, 1):
-        for task_idx, task in enumerate(project.get("tasks", []), 1):
-            if query.lower() in task["name"].lower():
-                matches.append({
-                    "project_index": proj_idx,
-                    "project_name": project["name"],
-                    "task_index": task_idx,
-                    "task": task
-                })
+    matches = _search(tool_context, _match_tasks, query.lower(), None)
 
     return {
         "action": "search_tasks",
         "query": query,
         "matches": matches,
         "count": len(matches),
-        "message": f"Found {len(matches)} tasks matching '{query}'",
-        "tasks": matches
+        "message": f"Found {len(matches)} tasks matching '{query}'"
     }
 
 
@@ -648,16 +803,10 @@ def find_project_by_name(name: str, tool_context: ToolContext) -> dict:
     Returns:
         The found project and its index, or an error message
     """
-    print(f"--- Tool: find_project_by_name called for '{name}' ---")
-
-    # Get projects from state
-    projects = tool_context.state.get("projects", [])
+    logger.debug("--- Tool: find_project_by_name called for '%s' ---", name)
 
     # Search for matches (case-insensitive)
-    matches = []
-    for idx, project in enumerate(projects, 1):
-        if name.lower() in project["name"].lower():
-            matches.append({"index": idx, "project": project})
+    matches = _search(tool_context, _match_projects, name.lower(), False)
 
     if not matches:
         return {
@@ -699,53 +848,38 @@ def find_tasks_by_status(status: str, project_index: Optional[int], tool_context
     Returns:
         The found task(s) and its/their index/indices, or an error message
     """
-    print(f"--- Tool: find_tasks_by_status called for '{status}' ---")
+    logger.debug("--- Tool: find_tasks_by_status called for '%s' ---", status)
 
     # Validate status
     status = status.lower()
-    valid_statuses = ["not started", "in progress", "completed"]
-    if status not in valid_statuses:
-        return {
-            "action": "find_tasks_by_status",
-            "status": "error",
-            "message": f"Invalid status: {status}. Please use one of: {', '.join(valid_statuses)}."
-        }
+    if status not in _VALID_STATUSES:
+        return _err(
+            "find_tasks_by_status", f"Invalid status: {status}. Please use one of: {_VALID_STATUSES_STR}.")
 
     # Get projects from state
     projects = tool_context.state.get("projects", [])
 
-    # Search for matches by status
-    matches = []
+    # Look up the tasks with this status
+    positions = _get_status_index(tool_context, projects)[status]
 
-    # If project_index is provided, only search in that project
+    # If project_index is provided, only keep matches in that project
     if project_index is not None:
-        if not projects or project_index < 1 or project_index > len(projects):
-            return {
-                "action": "find_tasks_by_status",
-                "status": "error",
-                "message": f"Could not find project at position {project_index}. Currently there are {len(projects)} projects."
-            }
-
-        project = projects[project_index - 1]
-        for task_idx, task in enumerate(project.get("tasks", []), 1):
-            if task["status"].lower() == status:
-                matches.append({
-                    "project_index": project_index,
-                    "project_name": project["name"],
-                    "task_index": task_idx,
-                    "task": task
-                })
-    else:
-        # Search across all projects
-        for proj_idx, project in enumerate(projects, 1):
-            for task_idx, task in enumerate(project.get("tasks", []), 1):
-                if task["status"].lower() == status:
-                    matches.append({
-                        "project_index": proj_idx,
-                        "project_name": project["name"],
-                        "task_index": task_idx,
-                        "task": task
-                    })
+        _, error = _get_indexed(
+            projects, project_index, "find_tasks_by_status", "project")
+        if error:
+            return error
+
+        positions = [pos for pos in positions if pos[0] == project_index]
+
+    matches = [
+        {
+            "project_index": proj_idx,
+            "project_name": projects[proj_idx - 1]["name"],
+            "task_index": task_idx,
+            "task": projects[proj_idx - 1]["tasks"][task_idx - 1]
+        }
+        for proj_idx, task_idx in positions
+    ]
 
     project_scope = f"in project {project_index}" if project_index else "across all projects"
 
@@ -780,44 +914,21 @@ def find_task_by_name(name: str, project_index: Optional[int], tool_context: Too
     Returns:
         The found task(s) and its/their index/indices, or an error message
     """
-    print(f"--- Tool: find_task_by_name called for '{name}' ---")
+    logger.debug("--- Tool: find_task_by_name called for '%s' ---", name)
 
     # Get projects from state
     projects = tool_context.state.get("projects", [])
 
-    # Search for matches (case-insensitive)
-    matches = []
-
     # If project_index is provided, only search in that project
     if project_index is not None:
-        if not projects or project_index < 1 or project_index > len(projects):
-            return {
-                "action": "find_task_by_name",
-                "status": "error",
-                "query": name,
-                "message": f"Could not find project at position {project_index}. Currently there are {len(projects)} projects."
-            }
-
-        project = projects[project_index - 1]
-        for task_idx, task in enumerate(project.get("tasks", []), 1):
-            if name.lower() in task["name"].lower():
-                matches.append({
-                    "project_index": project_index,
-                    "project_name": project["name"],
-                    "task_index": task_idx,
-                    "task": task
-                })
-    else:
-        # Search across all projects
-        for proj_idx, project in enumerate(projects, 1):
-            for task_idx, task in enumerate(project.get("tasks", []), 1):
-                if name.lower() in task["name"].lower():
-                    matches.append({
-                        "project_index": proj_idx,
-                        "project_name": project["name"],
-                        "task_index": task_idx,
-                        "task": task
-                    })
+        _, error = _get_indexed(
+            projects, project_index, "find_task_by_name", "project")
+        if error:
+            error["query"] = name
+            return error
+
+    # Search for matches (case-insensitive)
+    matches = _search(tool_context, _match_tasks, name.lower(), project_index)
 
     if not matches:
         project_scope = f"in project {project_index}" if project_index else "across all projects"
@@ -851,50 +962,39 @@ def get_project_status(project_index: int, tool_context: ToolContext) -> dict:
     Returns:
         Project status information
     """
-    print(f"--- Tool: get_project_status called for index {project_index} ---")
+    logger.debug("--- Tool: get_project_status called for index %s ---", project_index)
 
     # Get current projects from state
     projects = tool_context.state.get("projects", [])
 
     # Check if the project index is valid
-    if not projects or project_index < 1 or project_index > len(projects):
-        return {
-            "action": "get_project_status",
-            "status": "error",
-            "message": f"Could not find project at position {project_index}. Currently there are {len(projects)} projects."
-        }
+    project, error = _get_indexed(projects, project_index, "get_project_status", "project")
+    if error:
+        return error
 
-    # Get the project
-    project = projects[project_index - 1]
-    tasks = project.get("tasks", [])
+    tasks = project["tasks"]
+
+    # Organize tasks by status
+    tasks_by_status = {status: [] for status in TASK_STATUSES}
+
+    for task in tasks:
+        # Unknown status types are treated as not started; sessions that skipped
+        # the status migration (e.g. under adk web) may still hold mixed case
+        bucket = tasks_by_status.get(task["status"].lower())
+        if bucket is None:
+            bucket = tasks_by_status["not started"]
+        bucket.append(task)
 
     # Calculate completion status
     total_tasks = len(tasks)
-    completed_tasks = sum(1 for task in tasks if task["status"] == "completed")
+    completed_tasks = len(tasks_by_status["completed"])
     completion_percentage = 0 if total_tasks == 0 else (
         completed_tasks / total_tasks) * 100
 
-    # Organize tasks by status
-    tasks_by_status = {
-        "not started": [],
-        "in progress": [],
-        "completed": []
-    }
-
-    for task in tasks:
-        status = task["status"].lower()
-        if status in tasks_by_status:
-            tasks_by_status[status].append(task)
-        else:
-            # Handle unknown status types
-            if "not started" in tasks_by_status:
-                tasks_by_status["not started"].append(task)
-
     # Calculate days to deadline
     try:
-        due_date = datetime.strptime(project["due_date"], "%Y-%m-%d")
-        today = datetime.now()
-        days_remaining = (due_date - today).days
+        due_date = date.fromisoformat(project["due_date"])
+        days_remaining = (due_date - date.today()).days
         deadline_status = "overdue" if days_remaining < 0 else f"{days_remaining} days remaining"
     except ValueError:
         deadline_status = "unknown"
@@ -915,100 +1015,37 @@ def get_project_status(project_index: int, tool_context: ToolContext) -> dict:
 # Create the project management agent
 project_management_agent = Agent(
     name="project_management_agent",
-    model="gemini-2.0-flash-lite",
+    model=MODEL,
     description="A project management assistant with persistent memory for tracking projects, tasks, and team members",    
+    # The per-user state goes last so the fixed text before it is an identical
+    # prefix on every request, which Gemini can reuse from its prompt cache
     instruction="""
-    You are Dwight K. Schrute (from The Office series), Assistant Regional Manager and SUPERIOR project management specialist that remembers projects, tasks, and team members across conversations.
-        
-        The user's information is stored in state:
-        - User's name: {user_name}
-        - Projects: {projects}
-        - Team Members: {team_members}
-        
-        You can help users manage their projects with the following capabilities:
-        
-        1. Project Management
-        - Add new projects
-        - View existing projects
-        - Update projects
-        - Delete projects
-        - Get project status
-        - Search for projects by name or description
-        
-        2. Task Management
-        - Add tasks to projects
-        - Update tasks
-        - Delete tasks
-        - Search for tasks across all projects
-        
-        3. Team Management
-        - Add team members
-        - View team members
-        - Update team members
-        - Delete team members
-        
-        Always be friendly and address the user by name. If you don't know their name yet,
-        use the update_user_name tool to store it when they introduce themselves.
-        
-        **PROJECT MANAGEMENT GUIDELINES:**
-        
-        When dealing with projects and tasks:
-        
-        1. When the user asks to update or delete a project/task but doesn't provide an index:
-        - First try to find the project or task by name using find_project_by_name or find_task_by_name
-        - If they mention the name of the project or task, look through the list to find a match
-        - If you find a match, use that index
-        - If no match is found, list all projects/tasks and ask the user to specify
-        
-        2. When the user mentions a number or position:
-        - Use that as the index (e.g., "delete project 2" means index=2)
-        - Remember that indexing starts at 1 for the user
-        
-        3. For relative positions:
-        - Handle "first", "last", "second", etc. appropriately
-        - "First project" = index 1
-        - "Last project" = the highest index
-        
-        4. For viewing:
-        - Always use the view_projects or view_team_members tools when the user asks to see their information
-        - Format the response in a numbered list for clarity
-        - If there are no projects/members, suggest adding some
-        
-        5. For project status:
-        - Use the get_project_status tool to provide detailed information about a project's progress
-        - Include completion percentage and task breakdowns
-        - Mention the deadline status (days remaining or if overdue)
-        
-        6. For task management:
-        - Always specify both the project index and task index
-        - When updating task status, use standardized statuses: "not started", "in progress", "completed"
-        
-        7. Due Dates:
-        - Always use YYYY-MM-DD format for dates
-        - Remind users of upcoming deadlines when they view projects
-        - Warn users about overdue tasks or projects when relevant
-        
-        8. Search and Lookup Functionality:
-        - Use search_projects tool when users want to find specific projects by name or description
-        - Use search_tasks tool when users want to find specific tasks across all projects
-        - Use find_project_by_name when you need to find a specific project by name
-        - Use find_task_by_name when you need to find a specific task by name
-        - Use find_tasks_by_status when users ask about tasks with a specific status
-        - Present search results in a clear, numbered format
-        - If no results are found, suggest alternative search terms or actions
-        
-        9. Error Handling:
-        - Always validate user inputs before processing them
-        - Provide clear, helpful error messages when things go wrong
-        - Suggest corrections or alternatives when appropriate
-
-        Remember to explain that you can remember their information across conversations like Dwight K. Schrute.
-
+You are Dwight K. Schrute (from The Office series), Assistant Regional Manager and SUPERIOR project management specialist that remembers projects, tasks, and team members across conversations.
+
+Always be friendly and address the user by name (given below). If you don't know their name yet, use update_user_name to store it when they introduce themselves.
+
+Guidelines:
+1. Indexes start at 1 for the user ("project 2" means index=2, "first" = 1, "last" = the highest index). Task tools need both the project index and the task index.
+2. If the user names a project or task instead of giving a position, find it with find_project_by_name or find_task_by_name (or the summaries below). If nothing matches, list the options and ask.
+3. Use view_projects or view_team_members when the user asks to see their information (list_project_titles pages through long project lists), and present lists, search results and matches as numbered lists. If there is nothing yet, suggest adding some.
+4. Use get_project_status for progress: include the completion percentage, the task breakdown and the deadline status (days remaining or overdue).
+5. Task statuses are "not started", "in progress" or "completed". Dates are always YYYY-MM-DD. Remind users of upcoming deadlines and warn about overdue projects or tasks.
+6. Use search_projects / search_tasks for keyword searches and find_tasks_by_status for questions about a status. If a search finds nothing, suggest other terms.
+7. When the user asks for several independent things (e.g. "show my projects and team members"), call all the needed tools together in one turn. Deleting a project or task shifts the positions after it; make calls that depend on those positions only after the delete has returned.
+8. If a tool returns an error, explain it clearly and suggest a correction.
+
+Remember to explain that you can remember their information across conversations like Dwight K. Schrute.
+
+The user's information is stored in state:
+- User's name: {user_name}
+- Projects: {projects_summary}
+- Team Members: {team_summary}
     """,    
     tools=[
         # Project management tools
         add_project,
         view_projects,
+        list_project_titles,
         update_project,
         delete_project,
         get_project_status,
@@ -1,3 +1,4 @@
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.genai import types
 
 
@@ -28,6 +29,25 @@ class Colors:
     BG_WHITE = "\033[47m"
 
 
+# Stream the model's text as it is generated instead of waiting for the whole reply
+STREAMING_RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE)
+
+RESPONSE_HEADER = f"\n{Colors.BG_BLUE}{Colors.WHITE}{Colors.BOLD}╔══ AGENT RESPONSE ═════════════════════════════════════════{Colors.RESET}"
+RESPONSE_FOOTER = f"{Colors.BG_BLUE}{Colors.WHITE}{Colors.BOLD}╚═════════════════════════════════════════════════════════════{Colors.RESET}\n"
+
+
+class RecordingState(dict):
+    """Session state for running tools outside the agent; records which keys were written."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.written = set()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.written.add(key)
+
+
 def display_state(
     session_service, app_name, user_id, session_id, label="Current State"
 ):
@@ -77,8 +97,28 @@ def display_state(
         print(f"Error displaying state: {e}")
 
 
-async def process_agent_response(event):
-    """Process and display agent response events."""
+def print_partial_text(event, started):
+    """Print a streamed text chunk, opening the response box before the first one.
+
+    Returns:
+        True once any text has been printed for the current response
+    """
+    if not (event.content and event.content.parts):
+        return started
+    text = "".join(part.text for part in event.content.parts if part.text)
+    if not text:
+        return started
+    if not started:
+        print(RESPONSE_HEADER)
+    print(f"{Colors.CYAN}{Colors.BOLD}{text}{Colors.RESET}", end="", flush=True)
+    return True
+
+
+async def process_agent_response(event, streamed=False):
+    """Process and display agent response events.
+
+    If the event's text was already streamed, it is not printed again.
+    """
     # Log basic event info
     print(f"Event ID: {event.id}, Author: {event.author}")
 
@@ -103,7 +143,7 @@ async def process_agent_response(event):
                 print(f"  Tool Response: {part.tool_response.output}")
                 has_specific_part = True
             # Also print any text parts found in any event for debugging
-            elif hasattr(part, "text") and part.text and not part.text.isspace():
+            elif hasattr(part, "text") and part.text and not part.text.isspace() and not streamed:
                 print(f"  Text: '{part.text.strip()}'")
 
     # Check for final response after specific parts
@@ -116,14 +156,11 @@ async def process_agent_response(event):
             and event.content.parts[0].text
         ):
             final_response = event.content.parts[0].text.strip()
-            # Use colors and formatting to make the final response stand out
-            print(
-                f"\n{Colors.BG_BLUE}{Colors.WHITE}{Colors.BOLD}╔══ AGENT RESPONSE ═════════════════════════════════════════{Colors.RESET}"
-            )
-            print(f"{Colors.CYAN}{Colors.BOLD}{final_response}{Colors.RESET}")
-            print(
-                f"{Colors.BG_BLUE}{Colors.WHITE}{Colors.BOLD}╚═════════════════════════════════════════════════════════════{Colors.RESET}\n"
-            )
+            if not streamed:
+                # Use colors and formatting to make the final response stand out
+                print(RESPONSE_HEADER)
+                print(f"{Colors.CYAN}{Colors.BOLD}{final_response}{Colors.RESET}")
+                print(RESPONSE_FOOTER)
         else:
             print(
                 f"\n{Colors.BG_RED}{Colors.WHITE}{Colors.BOLD}==> Final Agent Response: [No text content in final event]{Colors.RESET}\n"
@@ -150,11 +187,24 @@ async def call_agent_async(runner, user_id, session_id, query):
     )
 
     try:
+        streamed = False
         async for event in runner.run_async(
-            user_id=user_id, session_id=session_id, new_message=content
+            user_id=user_id,
+            session_id=session_id,
+            new_message=content,
+            run_config=STREAMING_RUN_CONFIG,
         ):
+            # Show streamed text as it arrives; a complete event with the same text follows
+            if event.partial:
+                streamed = print_partial_text(event, streamed)
+                continue
+            if streamed:
+                print()
+                print(RESPONSE_FOOTER)
+
             # Process each event and get the final response if available
-            response = await process_agent_response(event)
+            response = await process_agent_response(event, streamed)
+            streamed = False
             if response:
                 final_response_text = response
     except Exception as e: